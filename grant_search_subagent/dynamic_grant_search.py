@@ -208,7 +208,7 @@ class DynamicGrantSearchEngine:
         
         # Step 2: Prioritize URLs using intelligent scoring
         context_keywords = set(self.search_keywords[:10])  # Use top keywords for context
-        url_scores = self.url_prioritizer.prioritize_urls(all_urls, context_keywords)
+        url_scores = self.url_prioritizer.prioritize_urls(all_urls, context_keywords, top_k=max_urls)
         
         # Step 3: Select top URLs for scraping
         top_urls = self.url_prioritizer.get_top_urls(url_scores, limit=max_urls)
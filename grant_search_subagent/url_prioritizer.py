@@ -8,6 +8,8 @@ import re
 from typing import List, Dict, Tuple, Set, Optional
 from dataclasses import dataclass
 from urllib.parse import urlparse, parse_qs
+from concurrent.futures import ProcessPoolExecutor
+import heapq
 import logging
 import sys
 import os
@@ -25,6 +27,146 @@ class URLScore:
     reasoning: List[str]
     category: str
 
+# Scoring tables live at module scope so they are built once per process
+# (and loaded from the compiled module cache) rather than per instance
+
+# High-priority grant keywords
+HIGH_PRIORITY_KEYWORDS = frozenset({
+    'funding', 'grant', 'awards', 'fellowship', 'scholarship',
+    'opportunities', 'rfp', 'solicitation', 'application',
+    'proposal', 'submission', 'deadline', 'open-call'
+})
+
+# Education and research specific terms
+EDUCATION_KEYWORDS = frozenset({
+    'education', 'leadership', 'curriculum', 'learning', 'training',
+    'development', 'capacity', 'institutional', 'transformation',
+    'innovation', 'research', 'academic', 'university', 'school'
+})
+
+# AI and technology terms
+AI_KEYWORDS = frozenset({
+    'artificial-intelligence', 'ai', 'machine-learning', 'technology',
+    'digital', 'computational', 'algorithm', 'automation', 'future',
+    'emerging', 'advanced', 'intelligent', 'cognitive'
+})
+
+# High-quality domains (known funders and foundations)
+TRUSTED_DOMAINS = {
+    # Government agencies
+    'nsf.gov': 10.0,
+    'nih.gov': 10.0,
+    'ed.gov': 9.5,
+    'energy.gov': 9.0,
+    'neh.gov': 9.0,
+    'nea.gov': 8.5,
+    'state.gov': 8.0,
+    
+    # Major foundations
+    'gatesfoundation.org': 10.0,
+    'fordfoundation.org': 9.5,
+    'rockefellerfoundation.org': 9.5,
+    'kresge.org': 9.0,
+    'macfound.org': 9.5,
+    'rwjf.org': 9.0,
+    'carnegie.org': 9.5,
+    'knightfoundation.org': 9.0,
+    
+    # Tech philanthropy
+    'chanzuckerberg.com': 10.0,
+    'mozilla.org': 8.5,
+    'omidyar.com': 8.5,
+    'templeton.org': 9.0,
+    'simonsfoundation.org': 9.5,
+    
+    # Research institutions
+    'harvard.edu': 8.0,
+    'mit.edu': 8.0,
+    'stanford.edu': 8.0,
+    'berkeley.edu': 7.5,
+    'princeton.edu': 8.0,
+    'yale.edu': 8.0,
+    
+    # Grant aggregators and databases
+    'grants.gov': 10.0,
+    'fundingalerts.com': 7.0,
+    'pivot.cos.com': 7.5,
+    'researchprofessional.com': 7.0,
+    'candid.org': 8.0,  # Foundation Directory Online
+    'grantspace.org': 7.5
+}
+
+# Indicators of high-value grants
+HIGH_VALUE_INDICATORS = (
+    r'\$\d{1,3}(?:,\d{3})*(?:,\d{3})*',  # Dollar amounts
+    r'\d+\s*million',
+    r'\d+M',
+    r'multi-year',
+    r'transformative',
+    r'breakthrough',
+    r'revolutionary',
+    r'innovative',
+    r'cutting-edge'
+)
+
+# Time-sensitive indicators
+URGENCY_INDICATORS = (
+    r'deadline',
+    r'due\s+\w+\s+\d{1,2}',
+    r'closes?\s+\w+\s+\d{1,2}',
+    r'application\s+period',
+    r'limited\s+time',
+    r'expires?',
+    r'final\s+call'
+)
+
+# Indicator patterns compiled once at import; each is counted separately
+_HIGH_VALUE_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in HIGH_VALUE_INDICATORS)
+_URGENCY_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in URGENCY_INDICATORS)
+
+# Quality indicators in URLs (plain substrings, matched without regex)
+QUALITY_URL_PATTERNS = (
+    '/funding',
+    '/grants',
+    '/opportunities',
+    '/awards',
+    '/apply',
+    '/application',
+    '/rfp',
+    '/solicitation'
+)
+
+# Fast path for absolute URLs: captures (netloc, path, query)
+_URL_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9+.-]*://([^/?#]+)([^?#]*)(?:\?([^#]*))?')
+
+def _split_url(url: str) -> Tuple[str, str, str]:
+    """Return the lowercased (domain, path, query) of a URL"""
+    match = _URL_RE.match(url)
+    # urlparse strips ';params' from the path, so leave those URLs to it
+    if match and ';' not in match.group(2):
+        return match.group(1).lower(), match.group(2).lower(), (match.group(3) or '').lower()
+    
+    parsed = urlparse(url)
+    return parsed.netloc.lower(), parsed.path.lower(), parsed.query.lower()
+
+# Batches smaller than this are scored in-process; below it the cost of
+# spawning workers and shipping results back outweighs the parallel speedup
+PARALLEL_THRESHOLD = 200
+
+# Per-process prioritizer built once by the pool initializer so each worker
+# reuses one instance and its scoring tables instead of rebuilding them per URL
+_worker_prioritizer = None
+
+def _init_prioritizer():
+    """Build the worker-local URLPrioritizer"""
+    global _worker_prioritizer
+    _worker_prioritizer = URLPrioritizer()
+
+def _score_chunk(args: Tuple[List[str], Optional[Set[str]]]) -> List[URLScore]:
+    """Score a chunk of URLs inside a worker process"""
+    urls, context_keywords = args
+    return [_worker_prioritizer._score_url(url, context_keywords) for url in urls]
+
 class URLPrioritizer:
     """
     Intelligent URL prioritization for grant discovery
@@ -40,134 +182,112 @@ class URLPrioritizer:
         """Initialize the URL prioritizer"""
         self.logger = GrantAgentLogger().get_logger("url_prioritizer")
         
-        # High-priority grant keywords
-        self.high_priority_keywords = {
-            'funding', 'grant', 'awards', 'fellowship', 'scholarship',
-            'opportunities', 'rfp', 'solicitation', 'application',
-            'proposal', 'submission', 'deadline', 'open-call'
-        }
-        
-        # Education and research specific terms
-        self.education_keywords = {
-            'education', 'leadership', 'curriculum', 'learning', 'training',
-            'development', 'capacity', 'institutional', 'transformation',
-            'innovation', 'research', 'academic', 'university', 'school'
-        }
-        
-        # AI and technology terms
-        self.ai_keywords = {
-            'artificial-intelligence', 'ai', 'machine-learning', 'technology',
-            'digital', 'computational', 'algorithm', 'automation', 'future',
-            'emerging', 'advanced', 'intelligent', 'cognitive'
-        }
-        
-        # High-quality domains (known funders and foundations)
-        self.trusted_domains = {
-            # Government agencies
-            'nsf.gov': 10.0,
-            'nih.gov': 10.0,
-            'ed.gov': 9.5,
-            'energy.gov': 9.0,
-            'neh.gov': 9.0,
-            'nea.gov': 8.5,
-            'state.gov': 8.0,
-            
-            # Major foundations
-            'gatesfoundation.org': 10.0,
-            'fordfoundation.org': 9.5,
-            'rockefellerfoundation.org': 9.5,
-            'kresge.org': 9.0,
-            'macfound.org': 9.5,
-            'rwjf.org': 9.0,
-            'carnegie.org': 9.5,
-            'knightfoundation.org': 9.0,
-            
-            # Tech philanthropy
-            'chanzuckerberg.com': 10.0,
-            'mozilla.org': 8.5,
-            'omidyar.com': 8.5,
-            'templeton.org': 9.0,
-            'simonsfoundation.org': 9.5,
-            
-            # Research institutions
-            'harvard.edu': 8.0,
-            'mit.edu': 8.0,
-            'stanford.edu': 8.0,
-            'berkeley.edu': 7.5,
-            'princeton.edu': 8.0,
-            'yale.edu': 8.0,
-            
-            # Grant aggregators and databases
-            'grants.gov': 10.0,
-            'fundingalerts.com': 7.0,
-            'pivot.cos.com': 7.5,
-            'researchprofessional.com': 7.0,
-            'candid.org': 8.0,  # Foundation Directory Online
-            'grantspace.org': 7.5
-        }
-        
-        # Indicators of high-value grants
-        self.high_value_indicators = [
-            r'\$\d{1,3}(?:,\d{3})*(?:,\d{3})*',  # Dollar amounts
-            r'\d+\s*million',
-            r'\d+M',
-            r'multi-year',
-            r'transformative',
-            r'breakthrough',
-            r'revolutionary',
-            r'innovative',
-            r'cutting-edge'
-        ]
-        
-        # Time-sensitive indicators
-        self.urgency_indicators = [
-            r'deadline',
-            r'due\s+\w+\s+\d{1,2}',
-            r'closes?\s+\w+\s+\d{1,2}',
-            r'application\s+period',
-            r'limited\s+time',
-            r'expires?',
-            r'final\s+call'
-        ]
-        
-        # Quality indicators in URLs
-        self.quality_url_patterns = [
-            r'/funding',
-            r'/grants',
-            r'/opportunities',
-            r'/awards',
-            r'/apply',
-            r'/application',
-            r'/rfp',
-            r'/solicitation'
-        ]
+        # Scoring tables are module constants shared by every instance
+        self.high_priority_keywords = HIGH_PRIORITY_KEYWORDS
+        self.education_keywords = EDUCATION_KEYWORDS
+        self.ai_keywords = AI_KEYWORDS
+        self.trusted_domains = TRUSTED_DOMAINS
+        self.high_value_indicators = _HIGH_VALUE_RES
+        self.urgency_indicators = _URGENCY_RES
+        self.quality_url_patterns = QUALITY_URL_PATTERNS
         
         self.logger.info("Initialized URLPrioritizer with comprehensive scoring system")
     
-    def prioritize_urls(self, urls: List[str], context_keywords: Optional[Set[str]] = None) -> List[URLScore]:
+    def prioritize_urls(self, urls: List[str], context_keywords: Optional[Set[str]] = None,
+                        max_workers: Optional[int] = None,
+                        top_k: Optional[int] = None) -> List[URLScore]:
         """
         Prioritize a list of URLs for scraping
         
+        Large batches are scored across CPU cores with a process pool;
+        small batches are scored in-process.
+        
         Args:
             urls: List of URLs to prioritize
             context_keywords: Optional set of context-specific keywords
+            max_workers: Optional worker process count (defaults to CPU count)
+            top_k: Optional limit; only the top K URLs are fully scored and returned
             
         Returns:
             List of URLScore objects sorted by priority (highest first)
         """
-        url_scores = []
+        num_procs = max_workers or os.cpu_count() or 1
         
-        for url in urls:
-            score = self._score_url(url, context_keywords)
-            url_scores.append(score)
+        if top_k is not None:
+            url_scores = self._score_top_k(urls, context_keywords, top_k)
+        elif len(urls) < PARALLEL_THRESHOLD or num_procs < 2:
+            url_scores = [self._score_url(url, context_keywords) for url in urls]
+        else:
+            url_scores = self._score_urls_parallel(urls, context_keywords, num_procs)
         
         # Sort by priority score (descending)
         url_scores.sort(key=lambda x: x.priority_score, reverse=True)
         
-        self.logger.info(f"Prioritized {len(urls)} URLs, top score: {url_scores[0].priority_score:.2f}")
+        if url_scores:
+            self.logger.info(f"Prioritized {len(urls)} URLs, top score: {url_scores[0].priority_score:.2f}")
         
         return url_scores
     
+    def _score_top_k(self, urls: List[str], context_keywords: Optional[Set[str]],
+                     top_k: int) -> List[URLScore]:
+        """
+        Score only the URLs that can still reach the top K
+        
+        Quality is cheap to compute, so URLs are visited in descending quality
+        order and the expensive relevance scoring is skipped once even a
+        perfect relevance score could not beat the current K-th best priority.
+        """
+        if top_k <= 0:
+            return []
+        
+        candidates = []
+        for index, url in enumerate(urls):
+            domain, path, _ = _split_url(url)
+            quality = self._calculate_quality_score(url, domain, path, [])
+            candidates.append((quality, index, url))
+        candidates.sort(key=lambda c: (-c[0], c[1]))
+        
+        # Min-heap of (priority, -index, score); ties favour earlier URLs,
+        # matching the stable sort used by the full prioritization path
+        heap = []
+        scored = 0
+        for quality, index, url in candidates:
+            if len(heap) >= top_k and (quality * 0.4) + (10.0 * 0.6) < heap[0][0]:
+                # Remaining candidates have lower quality, so none can qualify
+                break
+            
+            score = self._score_url(url, context_keywords)
+            scored += 1
+            entry = (score.priority_score, -index, score)
+            if len(heap) < top_k:
+                heapq.heappush(heap, entry)
+            elif entry[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, entry)
+        
+        self.logger.info(f"Fully scored {scored}/{len(urls)} URLs for top {top_k}")
+        heap.sort(key=lambda e: (-e[0], -e[1]))
+        return [entry[2] for entry in heap]
+    
+    def _score_urls_parallel(self, urls: List[str], context_keywords: Optional[Set[str]],
+                             num_procs: int) -> List[URLScore]:
+        """Score URLs in chunks across a pool of worker processes"""
+        chunk_size = max(1, len(urls) // num_procs)
+        chunks = [(urls[i:i + chunk_size], context_keywords)
+                  for i in range(0, len(urls), chunk_size)]
+        
+        try:
+            with ProcessPoolExecutor(max_workers=num_procs,
+                                     initializer=_init_prioritizer) as executor:
+                url_scores = []
+                for chunk_scores in executor.map(_score_chunk, chunks):
+                    url_scores.extend(chunk_scores)
+        except Exception as e:
+            self.logger.warning(f"Parallel URL scoring failed, falling back to serial: {e}")
+            return [self._score_url(url, context_keywords) for url in urls]
+        
+        self.logger.info(f"Scored {len(urls)} URLs across {num_procs} worker processes")
+        return url_scores
+    
     def _score_url(self, url: str, context_keywords: Optional[Set[str]] = None) -> URLScore:
         """
         Score a single URL for relevance and quality
@@ -182,10 +302,7 @@ class URLPrioritizer:
         reasoning = []
         
         # Parse URL components
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower()
-        path = parsed.path.lower()
-        query = parsed.query.lower()
+        domain, path, query = _split_url(url)
         
         # Calculate relevance score (0-10)
         relevance_score = self._calculate_relevance_score(
@@ -251,7 +368,7 @@ class URLPrioritizer:
         
         # Check for high-value indicators
         value_matches = sum(1 for pattern in self.high_value_indicators 
-                           if re.search(pattern, url, re.IGNORECASE))
+                           if pattern.search(url))
         if value_matches > 0:
             boost = min(value_matches * 1.5, 3.0)
             score += boost
@@ -259,7 +376,7 @@ class URLPrioritizer:
         
         # Check for urgency indicators
         urgency_matches = sum(1 for pattern in self.urgency_indicators 
-                             if re.search(pattern, url, re.IGNORECASE))
+                             if pattern.search(url))
         if urgency_matches > 0:
             boost = min(urgency_matches * 1.0, 2.0)
             score += boost
@@ -267,7 +384,7 @@ class URLPrioritizer:
         
         # Path-based relevance
         quality_path_matches = sum(1 for pattern in self.quality_url_patterns 
-                                  if re.search(pattern, path))
+                                  if pattern in path)
         if quality_path_matches > 0:
             boost = min(quality_path_matches * 1.2, 2.5)
             score += boost
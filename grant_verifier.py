@@ -13,7 +13,11 @@ import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse, urljoin
+from pathlib import Path
 import argparse
+import functools
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 
 # Add utils directory to path for logger
 sys.path.append(os.path.join(os.path.dirname(__file__), 'utils'))
@@ -23,9 +27,88 @@ try:
 except ImportError:
     LOGGER_AVAILABLE = False
 
+# httpx can multiplex HEAD requests to the same funder over one HTTP/2
+# connection; requests is used when it is not installed
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+    URL_REQUEST_ERRORS = (requests.RequestException, httpx.HTTPError, httpx.InvalidURL)
+except ImportError:
+    HTTPX_AVAILABLE = False
+    URL_REQUEST_ERRORS = (requests.RequestException,)
+
+# rapidfuzz ranks near-miss program names for better suggestions
+try:
+    from rapidfuzz import process as fuzz_process, fuzz
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# pyahocorasick finds every literal red flag phrase in one pass over a name
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Minimum rapidfuzz WRatio score for a known program to be suggested
+FUZZY_SUGGESTION_CUTOFF = 70
+
+# orjson parses bytes directly and is markedly faster than the stdlib parser
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Maximum number of URL status codes remembered per verifier
+URL_STATUS_CACHE_SIZE = 2048
+
+# Default thread count for batch verification; URL checks are network-bound,
+# so threads overlap request latency without contending on the GIL
+BATCH_MAX_WORKERS = 16
+
+# Collapse letters, digits and whitespace runs so a date string and the
+# format that parses it share the same shape (e.g. '9-9-9' for '%Y-%m-%d')
+_DATE_LETTERS_RE = re.compile(r'[A-Za-z]+')
+_DATE_DIGITS_RE = re.compile(r'\d+')
+_DATE_SPACES_RE = re.compile(r'\s+')
+
+# Red flag patterns without regex syntax are plain phrases
+_REGEX_META_RE = re.compile(r'[.^$*+?{}\[\]\\|()]')
+
+def _date_shape(value: str) -> str:
+    """Reduce a date string to a coarse shape used to pick its format"""
+    shape = _DATE_LETTERS_RE.sub('a', value.strip())
+    shape = _DATE_DIGITS_RE.sub('9', shape)
+    return _DATE_SPACES_RE.sub(' ', shape)
+
+@functools.lru_cache(maxsize=1024)
+def _parse_domain(url: str) -> str:
+    """Return the lowercased host of a URL without a leading 'www.'"""
+    return urlparse(url).netloc.lower().removeprefix("www.")
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime: float) -> Dict:
+    """
+    Parse a configuration file, memoized by path and modification time
+    The returned dict is shared between verifiers and must not be mutated
+    """
+    data = Path(config_path).read_bytes()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _contains_text(messages: List[str], text: str) -> bool:
+    """True if any message contains text, ignoring case; stops at the first hit"""
+    needle = text.casefold()
+    return any(needle in message.casefold() for message in messages)
+
 class GrantVerificationResult:
     """Result of grant verification with specific issues found"""
     
+    __slots__ = ('is_valid', 'errors', 'warnings', 'suggestions')
+    
     def __init__(self):
         self.is_valid = True
         self.errors = []
@@ -42,6 +125,14 @@ class GrantVerificationResult:
     def add_suggestion(self, message: str):
         self.suggestions.append(message)
     
+    def has_error(self, text: str) -> bool:
+        """Case-insensitive check for an error containing text"""
+        return _contains_text(self.errors, text)
+    
+    def has_warning(self, text: str) -> bool:
+        """Case-insensitive check for a warning containing text"""
+        return _contains_text(self.warnings, text)
+    
     def to_dict(self) -> Dict:
         return {
             "is_valid": self.is_valid,
@@ -50,9 +141,97 @@ class GrantVerificationResult:
             "suggestions": self.suggestions
         }
 
+class BatchVerificationResult:
+    """
+    Columnar results for a batch of grant verifications
+    
+    Instead of one result object with three lists per grant, validity is
+    kept in one list and messages in flat (grant_index, message) columns.
+    """
+    
+    def __init__(self, size: int):
+        self.is_valid = [True] * size
+        self.errors = []
+        self.warnings = []
+        self.suggestions = []
+        # Per-column grouping by grant index, rebuilt when the column grows
+        self._grouped = {}
+    
+    def __len__(self) -> int:
+        return len(self.is_valid)
+    
+    def row(self, index: int) -> "BatchResultRow":
+        """Writer for a single grant, usable wherever a GrantVerificationResult is"""
+        return BatchResultRow(self, index)
+    
+    def errors_for(self, index: int) -> List[str]:
+        return self._messages_for('errors', index)
+    
+    def warnings_for(self, index: int) -> List[str]:
+        return self._messages_for('warnings', index)
+    
+    def suggestions_for(self, index: int) -> List[str]:
+        return self._messages_for('suggestions', index)
+    
+    def _messages_for(self, column_name: str, index: int) -> List[str]:
+        """
+        Messages for one grant from a (grant_index, message) column
+        
+        Threaded verification appends rows out of index order, so the column
+        is grouped by index in one pass and reused until it grows.
+        """
+        column = getattr(self, column_name)
+        cached = self._grouped.get(column_name)
+        if cached is None or cached[0] != len(column):
+            grouped = [[] for _ in self.is_valid]
+            for i, message in column:
+                grouped[i].append(message)
+            cached = (len(column), grouped)
+            self._grouped[column_name] = cached
+        return list(cached[1][index])
+    
+    def to_results(self) -> List[GrantVerificationResult]:
+        """Expand into one GrantVerificationResult per grant"""
+        results = [GrantVerificationResult() for _ in self.is_valid]
+        for result, is_valid in zip(results, self.is_valid):
+            result.is_valid = is_valid
+        for index, message in self.errors:
+            results[index].errors.append(message)
+        for index, message in self.warnings:
+            results[index].warnings.append(message)
+        for index, message in self.suggestions:
+            results[index].suggestions.append(message)
+        return results
+
+class BatchResultRow:
+    """Writes one grant's findings into a BatchVerificationResult"""
+    
+    __slots__ = ('_batch', '_index')
+    
+    def __init__(self, batch: BatchVerificationResult, index: int):
+        self._batch = batch
+        self._index = index
+    
+    @property
+    def is_valid(self) -> bool:
+        return self._batch.is_valid[self._index]
+    
+    def add_error(self, message: str):
+        self._batch.is_valid[self._index] = False
+        self._batch.errors.append((self._index, message))
+    
+    def add_warning(self, message: str):
+        self._batch.warnings.append((self._index, message))
+    
+    def add_suggestion(self, message: str):
+        self._batch.suggestions.append((self._index, message))
+
 class GrantVerifier:
     """Verifies grant accuracy against known patterns and official sources"""
     
+    # Fields checked when the configuration does not list its own
+    DEFAULT_REQUIRED_FIELDS = ('organization_name', 'grant_name')
+    
     def __init__(self, config_path: str = None):
         """Initialize verifier with centralized configuration"""
         
@@ -69,19 +248,91 @@ class GrantVerifier:
         self.config = self._load_config(config_path)
         
         # Extract configuration components
+        self._apply_config()
+        
+        # Shared client keeps connections alive across URL checks
+        self._session = self._create_http_client()
+        
+        # Remember HEAD results so repeated URLs are only requested once
+        self._cached_url_status = functools.lru_cache(maxsize=URL_STATUS_CACHE_SIZE)(self._fetch_url_status)
+        
+        if self.logger:
+            self.logger.info(f"GrantVerifier initialized with {len(self.known_funders)} known funders")
+    
+    def _apply_config(self):
+        """Extract configuration components and precompute lookup structures"""
         self.known_funders = self.config.get('foundation_seeds', {})
+        self._known_funder_names = list(self.known_funders.keys())
+        self._known_funder_keys = {name.casefold(): name for name in self.known_funders}
         self.validation_rules = self.config.get('validation_rules', {})
         self.red_flag_patterns = self.validation_rules.get('red_flag_patterns', [])
         self.deadline_config = self.validation_rules.get('deadline_validation', {})
+        self._required_fields = tuple(self.validation_rules.get('required_fields', self.DEFAULT_REQUIRED_FIELDS))
         
-        if self.logger:
-            self.logger.info(f"GrantVerifier initialized with {len(self.known_funders)} known funders")
+        # Exact program names per funder for single-probe membership tests
+        self._known_programs_set = {
+            org: frozenset(info.get("known_programs", []))
+            for org, info in self.known_funders.items()
+        }
+        
+        # Lowercase known program names once for partial matching
+        self._known_programs_lower = {
+            org: [(program, program.lower()) for program in info.get("known_programs", [])]
+            for org, info in self.known_funders.items()
+        }
+        
+        # Compile red flag patterns once instead of on every check
+        self._red_flag_compiled = []
+        for pattern in self.red_flag_patterns:
+            try:
+                self._red_flag_compiled.append((pattern, re.compile(pattern, re.IGNORECASE)))
+            except re.error as e:
+                if self.logger:
+                    self.logger.warning(f"Skipping invalid red flag pattern '{pattern}': {e}")
+        
+        # Literal phrases go into an Aho-Corasick automaton when available;
+        # the rest keep their compiled regex, tagged with their config index
+        self._red_flag_automaton = None
+        self._red_flag_scanned = [(index, compiled) for index, (_, compiled) in enumerate(self._red_flag_compiled)]
+        if AHOCORASICK_AVAILABLE:
+            literals = [(index, pattern) for index, (pattern, _) in enumerate(self._red_flag_compiled)
+                        if not _REGEX_META_RE.search(pattern)]
+            if literals:
+                self._red_flag_automaton = ahocorasick.Automaton()
+                for index, pattern in literals:
+                    self._red_flag_automaton.add_word(pattern.lower(), index)
+                self._red_flag_automaton.make_automaton()
+                literal_indexes = {index for index, _ in literals}
+                self._red_flag_scanned = [(index, compiled) for index, compiled in self._red_flag_scanned
+                                          if index not in literal_indexes]
+        
+        # Single case-insensitive alternation over every pattern, used to rule
+        # out clean grant names in one search without a lowercased copy
+        self._red_flag_union = None
+        if self._red_flag_compiled:
+            try:
+                self._red_flag_union = re.compile(
+                    "|".join(f"(?:{pattern})" for pattern, _ in self._red_flag_compiled),
+                    re.IGNORECASE
+                )
+            except re.error:
+                # Patterns with inline global flags cannot be combined
+                self._red_flag_union = None
+        
+        # Index deadline formats by the shape of a sample date they produce
+        self._deadline_formats_by_shape = {}
+        sample_date = datetime(2000, 12, 28, 23, 59, 59)
+        for date_format in self.deadline_config.get('supported_formats', ['%Y-%m-%d']):
+            try:
+                shape = _date_shape(sample_date.strftime(date_format))
+            except ValueError:
+                continue
+            self._deadline_formats_by_shape.setdefault(shape, []).append(date_format)
     
     def _load_config(self, config_path: str) -> Dict:
         """Load configuration from JSON file with fallback"""
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            config = _load_config_cached(config_path, os.path.getmtime(config_path))
             
             if self.logger:
                 self.logger.info(f"Loaded configuration from {config_path}")
@@ -157,10 +408,7 @@ class GrantVerifier:
             self.config = self._load_config(config_path)
             
             # Re-extract configuration components
-            self.known_funders = self.config.get('foundation_seeds', {})
-            self.validation_rules = self.config.get('validation_rules', {})
-            self.red_flag_patterns = self.validation_rules.get('red_flag_patterns', [])
-            self.deadline_config = self.validation_rules.get('deadline_validation', {})
+            self._apply_config()
             
             if self.logger:
                 self.logger.info(f"Configuration reloaded: {old_funder_count} -> {len(self.known_funders)} funders")
@@ -176,16 +424,17 @@ class GrantVerifier:
         """Get summary of current configuration"""
         return {
             'total_funders': len(self.known_funders),
-            'funders': list(self.known_funders.keys()),
+            'funders': list(self._known_funder_names),
             'red_flag_patterns_count': len(self.red_flag_patterns),
             'required_fields': self.validation_rules.get('required_fields', []),
             'deadline_formats_supported': len(self.deadline_config.get('supported_formats', [])),
             'config_loaded': bool(self.config)
         }
     
-    def verify_grant_entry(self, grant_data: Dict) -> GrantVerificationResult:
+    def verify_grant_entry(self, grant_data: Dict, result: Optional[GrantVerificationResult] = None) -> GrantVerificationResult:
         """Main verification method for grant entries"""
-        result = GrantVerificationResult()
+        if result is None:
+            result = GrantVerificationResult()
         
         if self.logger:
             self.logger.debug("Starting grant verification")
@@ -213,12 +462,16 @@ class GrantVerifier:
         # 2. Verify organization exists and is known
         self._verify_organization(org_name, result)
         
+        # Program and URL checks look up the configured funder name, so
+        # "simons foundation" is checked against "Simons Foundation"
+        funder_key = self._resolve_funder(org_name)
+        
         # 3. Verify grant name against known programs
-        self._verify_grant_name(org_name, grant_name, result)
+        self._verify_grant_name(funder_key, grant_name, result)
         
         # 4. Verify grant URL is valid and accessible
         if grant_url:
-            self._verify_grant_url(org_name, grant_url, result)
+            self._verify_grant_url(funder_key, grant_url, result)
         
         # 5. Check for red flag patterns
         self._check_red_flags(grant_name, result)
@@ -235,14 +488,53 @@ class GrantVerifier:
         
         return result
     
+    def verify_grants_batch(self, grants: List[Dict], max_workers: int = BATCH_MAX_WORKERS) -> List[GrantVerificationResult]:
+        """
+        Verify many grant entries concurrently
+        
+        Verification is dominated by URL HEAD requests, which are I/O-bound,
+        so entries are checked on a thread pool sharing one HTTP session.
+        
+        Args:
+            grants: List of grant entry dictionaries
+            max_workers: Maximum number of worker threads
+            
+        Returns:
+            List of GrantVerificationResult objects in input order
+        """
+        if len(grants) <= 1 or max_workers <= 1:
+            return [self.verify_grant_entry(grant) for grant in grants]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(grants))) as executor:
+            results = list(executor.map(self.verify_grant_entry, grants))
+        
+        if self.logger:
+            self.logger.info(f"Batch verified {len(grants)} grants, {sum(r.is_valid for r in results)} valid")
+        
+        return results
+    
+    def verify_grants_columnar(self, grants: List[Dict], max_workers: int = BATCH_MAX_WORKERS) -> BatchVerificationResult:
+        """
+        Verify many grant entries into a single columnar result
+        
+        Same checks and threading as verify_grants_batch, but findings are
+        written into shared columns rather than per-grant result objects.
+        """
+        batch = BatchVerificationResult(len(grants))
+        rows = [batch.row(index) for index in range(len(grants))]
+        
+        if len(grants) <= 1 or max_workers <= 1:
+            for grant, row in zip(grants, rows):
+                self.verify_grant_entry(grant, row)
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(grants))) as executor:
+                list(executor.map(self.verify_grant_entry, grants, rows))
+        
+        return batch
+    
     def _verify_required_fields(self, grant_data: Dict, result: GrantVerificationResult):
         """Verify required fields are present and non-empty"""
-        required_fields = self.validation_rules.get('required_fields', ['organization_name', 'grant_name'])
-        
-        missing_fields = []
-        for field in required_fields:
-            if not grant_data.get(field):
-                missing_fields.append(field)
+        missing_fields = [field for field in self._required_fields if not grant_data.get(field)]
         
         if missing_fields:
             result.add_error(f"Missing required fields: {', '.join(missing_fields)}")
@@ -260,37 +552,53 @@ class GrantVerifier:
             elif len(description) > max_length:
                 result.add_warning(f"Description is too long ({len(description)} chars, maximum {max_length})")
     
+    def _resolve_funder(self, org_name: str) -> str:
+        """Return the configured funder name for org_name, ignoring case"""
+        if not isinstance(org_name, str) or org_name in self.known_funders:
+            return org_name
+        return self._known_funder_keys.get(org_name.casefold(), org_name)
+    
     def _verify_organization(self, org_name: str, result: GrantVerificationResult):
         """Verify organization name against known funders"""
-        if org_name not in self.known_funders:
+        # Exact probe first, then a case-insensitive one ("simons foundation")
+        if self._resolve_funder(org_name) not in self.known_funders:
             result.add_warning(f"Organization '{org_name}' not in verified funder database")
-            result.add_suggestion(f"Consider using one of: {list(self.known_funders.keys())}")
+            result.add_suggestion(f"Consider using one of: {self._known_funder_names}")
         
     def _verify_grant_name(self, org_name: str, grant_name: str, result: GrantVerificationResult):
         """Verify grant name against known programs for the organization"""
         if org_name in self.known_funders:
-            known_programs = self.known_funders[org_name]["known_programs"]
-            
             # Exact match
-            if grant_name in known_programs:
+            if grant_name in self._known_programs_set[org_name]:
                 return
             
+            known_programs = self.known_funders[org_name]["known_programs"]
+            
             # Partial match
-            partial_matches = [p for p in known_programs if grant_name.lower() in p.lower() or p.lower() in grant_name.lower()]
+            grant_lower = grant_name.lower()
+            partial_matches = [p for p, p_lower in self._known_programs_lower[org_name]
+                               if grant_lower in p_lower or p_lower in grant_lower]
             if partial_matches:
+                best_match = partial_matches[0]
+                if RAPIDFUZZ_AVAILABLE and len(partial_matches) > 1:
+                    best_match = fuzz_process.extractOne(grant_name, partial_matches, scorer=fuzz.WRatio)[0]
                 result.add_warning(f"Grant name '{grant_name}' may be imprecise")
-                result.add_suggestion(f"Consider exact name: {partial_matches[0]}")
+                result.add_suggestion(f"Consider exact name: {best_match}")
                 return
             
             # No match found
             result.add_error(f"Grant '{grant_name}' not found in {org_name}'s known programs")
+            if RAPIDFUZZ_AVAILABLE:
+                closest = fuzz_process.extractOne(grant_name, known_programs, scorer=fuzz.WRatio,
+                                                  score_cutoff=FUZZY_SUGGESTION_CUTOFF)
+                if closest:
+                    result.add_suggestion(f"Closest known program: {closest[0]}")
             result.add_suggestion(f"Known {org_name} programs: {', '.join(known_programs)}")
     
     def _verify_grant_url(self, org_name: str, grant_url: str, result: GrantVerificationResult):
         """Verify grant URL is from correct domain and accessible"""
         try:
-            parsed_url = urlparse(grant_url)
-            domain = parsed_url.netloc.lower().replace("www.", "")
+            domain = _parse_domain(grant_url)
             
             # Check domain matches known funder domains
             if org_name in self.known_funders:
@@ -299,34 +607,84 @@ class GrantVerifier:
                     result.add_error(f"URL domain '{domain}' doesn't match {org_name} expected domains: {expected_domains}")
             
             # Check URL is accessible (with timeout)
-            response = requests.head(grant_url, timeout=10, allow_redirects=True)
-            if response.status_code >= 400:
-                result.add_error(f"Grant URL returns {response.status_code} error")
-            elif response.status_code >= 300:
-                result.add_warning(f"Grant URL redirects (status: {response.status_code})")
+            status_code = self._cached_url_status(grant_url)
+            if status_code >= 400:
+                result.add_error(f"Grant URL returns {status_code} error")
+            elif status_code >= 300:
+                result.add_warning(f"Grant URL redirects (status: {status_code})")
             
-        except requests.RequestException as e:
+        except URL_REQUEST_ERRORS as e:
             result.add_error(f"Cannot access grant URL: {str(e)}")
         except Exception as e:
             result.add_warning(f"URL validation error: {str(e)}")
     
+    def _fetch_url_status(self, grant_url: str) -> int:
+        """Issue a HEAD request and return the final status code"""
+        if HTTPX_AVAILABLE:
+            response = self._session.head(grant_url)
+        else:
+            response = self._session.head(grant_url, timeout=10, allow_redirects=True)
+        return response.status_code
+    
+    def close(self):
+        """Close the pooled HTTP client"""
+        self._session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _create_http_client(self):
+        """Create the pooled HTTP client used for URL checks"""
+        if HTTPX_AVAILABLE:
+            # HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 keep-alive
+            http2 = importlib.util.find_spec("h2") is not None
+            return httpx.Client(
+                http2=http2,
+                follow_redirects=True,
+                timeout=10.0,
+                limits=httpx.Limits(max_connections=BATCH_MAX_WORKERS)
+            )
+        
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=BATCH_MAX_WORKERS)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
     def _check_red_flags(self, grant_name: str, result: GrantVerificationResult):
         """Check for patterns that indicate made-up grant names"""
-        grant_lower = grant_name.lower()
-        for pattern in self.red_flag_patterns:
-            if re.search(pattern, grant_lower):
-                result.add_error(f"Grant name matches red flag pattern: '{pattern}'")
-                result.add_suggestion("Use exact program names from official sources only")
+        if self._red_flag_union is not None and not self._red_flag_union.search(grant_name):
+            return
+        
+        # At least one pattern matched; find every pattern that applies
+        hits = set()
+        if self._red_flag_automaton is not None:
+            hits.update(index for _, index in self._red_flag_automaton.iter(grant_name.lower()))
+        hits.update(index for index, compiled in self._red_flag_scanned if compiled.search(grant_name))
+        
+        # Report in configuration order
+        for index in sorted(hits):
+            pattern = self._red_flag_compiled[index][0]
+            result.add_error(f"Grant name matches red flag pattern: '{pattern}'")
+            result.add_suggestion("Use exact program names from official sources only")
     
-    def _verify_deadline(self, deadline: str, result: GrantVerificationResult):
+    def _verify_deadline(self, deadline: str, result: GrantVerificationResult, now: Optional[datetime] = None):
         """Verify deadline is not in the past using configured date formats"""
         try:
             # Get supported date formats from configuration
             supported_formats = self.deadline_config.get('supported_formats', ['%Y-%m-%d'])
             warning_threshold = self.deadline_config.get('warning_days_threshold', 7)
             
+            # Try formats whose shape matches the deadline first, so the common
+            # case parses on the first attempt instead of raising per format
+            likely_formats = self._deadline_formats_by_shape.get(_date_shape(deadline), [])
+            ordered_formats = likely_formats + [f for f in supported_formats if f not in likely_formats]
+            
             # Parse various date formats
-            for date_format in supported_formats:
+            for date_format in ordered_formats:
                 try:
                     deadline_date = datetime.strptime(deadline, date_format)
                     break
@@ -337,21 +695,26 @@ class GrantVerifier:
                 result.add_suggestion(f"Supported formats: {', '.join(supported_formats)}")
                 return
             
-            if deadline_date < datetime.now():
+            if now is None:
+                now = datetime.now()
+            
+            if deadline_date < now:
                 result.add_error(f"Deadline {deadline} is in the past")
-            elif deadline_date < datetime.now() + timedelta(days=warning_threshold):
+            elif deadline_date < now + timedelta(days=warning_threshold):
                 result.add_warning(f"Deadline {deadline} is very soon (less than {warning_threshold} days)")
                 
         except Exception as e:
             result.add_warning(f"Deadline validation error: {str(e)}")
 
-def validate_grant_from_json(json_file: str) -> GrantVerificationResult:
+def validate_grant_from_json(json_file: str, verifier: Optional[GrantVerifier] = None) -> GrantVerificationResult:
     """Validate grant from JSON file"""
     try:
         with open(json_file, 'r') as f:
             grant_data = json.load(f)
         
-        verifier = GrantVerifier()
+        if verifier is None:
+            with GrantVerifier() as own_verifier:
+                return own_verifier.verify_grant_entry(grant_data)
         return verifier.verify_grant_entry(grant_data)
         
     except Exception as e:
@@ -359,6 +722,13 @@ def validate_grant_from_json(json_file: str) -> GrantVerificationResult:
         result.add_error(f"Error reading grant file: {str(e)}")
         return result
 
+def validate_grants_from_json(json_files: List[str], verifier: Optional[GrantVerifier] = None) -> List[GrantVerificationResult]:
+    """Validate several grant JSON files with a single verifier"""
+    if verifier is None:
+        with GrantVerifier() as own_verifier:
+            return [validate_grant_from_json(json_file, own_verifier) for json_file in json_files]
+    return [validate_grant_from_json(json_file, verifier) for json_file in json_files]
+
 def main():
     """Main function for command line usage"""
     parser = argparse.ArgumentParser(description="Verify grant entry accuracy")
@@ -370,60 +740,57 @@ def main():
     
     args = parser.parse_args()
     
-    # Initialize verifier with specified config
-    verifier = GrantVerifier(config_path=args.config)
-    
-    # Show configuration if requested
-    if args.show_config:
-        if not args.quiet:
-            print("GRANT VERIFIER CONFIGURATION:")
-            print("="*50)
-            
-            config_summary = verifier.get_config_summary()
-            for key, value in config_summary.items():
-                if isinstance(value, list) and len(value) > 5:
-                    print(f"  {key}: {len(value)} items ({value[:3]}...)")
-                else:
-                    print(f"  {key}: {value}")
+    # Initialize verifier with specified config; closed on every exit path
+    with GrantVerifier(config_path=args.config) as verifier:
+        # Show configuration if requested
+        if args.show_config:
+            if not args.quiet:
+                print("GRANT VERIFIER CONFIGURATION:")
+                print("="*50)
+                
+                config_summary = verifier.get_config_summary()
+                for key, value in config_summary.items():
+                    if isinstance(value, list) and len(value) > 5:
+                        print(f"  {key}: {len(value)} items ({value[:3]}...)")
+                    else:
+                        print(f"  {key}: {value}")
+                
+                print()
             
-            print()
+            if not args.grant_file:
+                return
         
+        # Validate grant file if provided
         if not args.grant_file:
-            return
-    
-    # Validate grant file if provided
-    if not args.grant_file:
-        print("ERROR: --grant-file is required unless using --show-config only")
-        sys.exit(1)
-    
-    result = validate_grant_from_json(args.grant_file)
-    
-    if not args.quiet:
-        print("GRANT VERIFIER RESULTS:")
-        print("="*50)
+            print("ERROR: --grant-file is required unless using --show-config only")
+            sys.exit(1)
         
-        if result.errors:
-            print("❌ ERRORS:")
-            for error in result.errors:
-                print(f"  • {error}")
+        result = validate_grant_from_json(args.grant_file, verifier)
         
-        if result.warnings:
-            print("⚠️  WARNINGS:")
-            for warning in result.warnings:
-                print(f"  • {warning}")
+        if not args.quiet:
+            # Build the report first and write it in one call
+            lines = ["GRANT VERIFIER RESULTS:", "="*50]
+            
+            if result.errors:
+                lines.append("❌ ERRORS:")
+                lines.extend(f"  • {error}" for error in result.errors)
+            
+            if result.warnings:
+                lines.append("⚠️  WARNINGS:")
+                lines.extend(f"  • {warning}" for warning in result.warnings)
+            
+            if result.suggestions:
+                lines.append("💡 SUGGESTIONS:")
+                lines.extend(f"  • {suggestion}" for suggestion in result.suggestions)
+            
+            lines.append(f"\n✅ Valid: {result.is_valid}")
+            sys.stdout.write("\n".join(lines) + "\n")
         
-        if result.suggestions:
-            print("💡 SUGGESTIONS:")
-            for suggestion in result.suggestions:
-                print(f"  • {suggestion}")
+        # Exit with error code if validation failed
+        if not result.is_valid or (args.strict and result.warnings):
+            sys.exit(1)
         
-        print(f"\n✅ Valid: {result.is_valid}")
-    
-    # Exit with error code if validation failed
-    if not result.is_valid or (args.strict and result.warnings):
-        sys.exit(1)
-    
-    sys.exit(0)
+        sys.exit(0)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -18,13 +18,26 @@ LIMITS = {
     'proposal_long': 2000,  # Word limit for long proposals
 }
 
+# Section patterns used by validate_and_fix_proposal, compiled once at import
+_TWEET_RE = re.compile(r'(.*tweet.*<140.*?:)\s*(.*?)(?=\n\*\*|\n\n|\Z)', re.IGNORECASE | re.DOTALL)
+_PROPOSAL_RE = re.compile(r'(.*<500 words.*?:)\s*(.*?)(?=\n\*\*|\n\n\*\*|\Z)', re.IGNORECASE | re.DOTALL)
+_EXTRA_PATTERNS = [
+    (re.compile(r'(.*1-2 sentences.*?:)\s*(.*?)(?=\n\*\*|\n\n|\Z)', re.IGNORECASE | re.DOTALL), 280, 'char', '1-2 sentences'),  # 1-2 sentences
+    (re.compile(r'(.*elevator pitch.*?:)\s*(.*?)(?=\n\*\*|\n\n|\Z)', re.IGNORECASE | re.DOTALL), 100, 'word', 'elevator pitch'),  # Elevator pitch
+    (re.compile(r'(.*abstract.*?:)\s*(.*?)(?=\n\*\*|\n\n|\Z)', re.IGNORECASE | re.DOTALL), 250, 'word', 'abstract'),  # Abstract
+]
+
+# Text on either side of an em dash, used to pick dashes to rewrite
+_EM_DASH_CONTEXT_RE = re.compile(r'([^—\n]{10,50})\s*—\s*([^—\n]{10,50})')
+
 def count_characters(text):
     """Count characters excluding leading/trailing whitespace"""
     return len(text.strip())
 
 def count_words(text):
     """Count words in text"""
-    return len(text.strip().split())
+    # split() already ignores leading/trailing whitespace, so no strip() copy
+    return len(text.split())
 
 def truncate_to_char_limit(text, limit):
     """Truncate text to character limit, breaking at word boundaries when possible"""
@@ -43,23 +56,62 @@ def truncate_to_char_limit(text, limit):
 
 def truncate_to_word_limit(text, limit):
     """Truncate text to word limit"""
-    words = text.strip().split()
+    # Splitting at most `limit` times leaves any remaining words in one tail
+    # item, so long texts never materialize a list of every word
+    words = text.split(None, limit)
     if len(words) <= limit:
         return text
     
-    return ' '.join(words[:limit])
+    # Drop the unsplit tail in place rather than copying the first `limit` words
+    words.pop()
+    return ' '.join(words)
+
+def _apply_replacements(text, spans):
+    """
+    Rebuild text in one pass from (start, end, replacement) spans
+    Spans overlapping an earlier-listed span are skipped, so earlier fixes win
+    """
+    accepted = []
+    for start, end, replacement in spans:
+        if any(start < a_end and a_start < end for a_start, a_end, _ in accepted):
+            continue
+        accepted.append((start, end, replacement))
+    
+    if not accepted:
+        return text
+    
+    accepted.sort()
+    parts = []
+    position = 0
+    for start, end, replacement in accepted:
+        parts.append(text[position:start])
+        parts.append(replacement)
+        position = end
+    parts.append(text[position:])
+    return ''.join(parts)
 
 def validate_and_fix_proposal(content):
     """
     Validate proposal content and automatically fix limit violations
     Returns tuple: (fixed_content, violations_found)
     """
+    # Every section label ends in a colon; without one there is nothing to
+    # fix, so skip case-folding and go straight to draft balancing
+    if ':' not in content:
+        return balance_document_sections(content)
+    
     violations = []
-    fixed_content = content
+    replacements = []
+    
+    # Each pattern needs a literal keyword; skip the regex scan when the
+    # (case-folded) content does not contain it
+    content_folded = content.casefold()
     
     # Check for tweet descriptions (140 characters)
-    tweet_pattern = r'(.*tweet.*<140.*?:)\s*(.*?)(?=\n\*\*|\n\n|\Z)'
-    tweet_matches = re.finditer(tweet_pattern, content, re.IGNORECASE | re.DOTALL)
+    if 'tweet' in content_folded and '<140' in content_folded:
+        tweet_matches = _TWEET_RE.finditer(content)
+    else:
+        tweet_matches = ()
     
     for match in tweet_matches:
         label = match.group(1)
@@ -69,11 +121,13 @@ def validate_and_fix_proposal(content):
         if char_count > 140:
             violations.append(f"Tweet description: {char_count}/140 characters")
             fixed_tweet = truncate_to_char_limit(tweet_text, 140)
-            fixed_content = fixed_content.replace(match.group(0), label + "\n" + fixed_tweet)
+            replacements.append((match.end(1), match.end(), "\n" + fixed_tweet))
     
     # Check for short proposals (500 words)
-    proposal_pattern = r'(.*<500 words.*?:)\s*(.*?)(?=\n\*\*|\n\n\*\*|\Z)'
-    proposal_matches = re.finditer(proposal_pattern, content, re.IGNORECASE | re.DOTALL)
+    if '<500 words' in content_folded:
+        proposal_matches = _PROPOSAL_RE.finditer(content)
+    else:
+        proposal_matches = ()
     
     for match in proposal_matches:
         label = match.group(1)
@@ -83,17 +137,14 @@ def validate_and_fix_proposal(content):
         if word_count > 500:
             violations.append(f"Short proposal: {word_count}/500 words")
             fixed_proposal = truncate_to_word_limit(proposal_text, 500)
-            fixed_content = fixed_content.replace(match.group(0), label + "\n\n" + fixed_proposal)
+            replacements.append((match.end(1), match.end(), "\n\n" + fixed_proposal))
     
     # Check for other common patterns
-    patterns = [
-        (r'(.*1-2 sentences.*?:)\s*(.*?)(?=\n\*\*|\n\n|\Z)', 280, 'char'),  # 1-2 sentences
-        (r'(.*elevator pitch.*?:)\s*(.*?)(?=\n\*\*|\n\n|\Z)', 100, 'word'),  # Elevator pitch
-        (r'(.*abstract.*?:)\s*(.*?)(?=\n\*\*|\n\n|\Z)', 250, 'word'),  # Abstract
-    ]
-    
-    for pattern, limit, limit_type in patterns:
-        matches = re.finditer(pattern, content, re.IGNORECASE | re.DOTALL)
+    for pattern, limit, limit_type, keyword in _EXTRA_PATTERNS:
+        if keyword not in content_folded:
+            continue
+        
+        matches = pattern.finditer(content)
         for match in matches:
             label = match.group(1)
             text = match.group(2).strip()
@@ -103,13 +154,17 @@ def validate_and_fix_proposal(content):
                 if count > limit:
                     violations.append(f"{label.strip()}: {count}/{limit} characters")
                     fixed_text = truncate_to_char_limit(text, limit)
-                    fixed_content = fixed_content.replace(match.group(0), label + "\n" + fixed_text)
+                    replacements.append((match.end(1), match.end(), "\n" + fixed_text))
             else:  # word
                 count = count_words(text)
                 if count > limit:
                     violations.append(f"{label.strip()}: {count}/{limit} words")
                     fixed_text = truncate_to_word_limit(text, limit)
-                    fixed_content = fixed_content.replace(match.group(0), label + "\n" + fixed_text)
+                    replacements.append((match.end(1), match.end(), "\n" + fixed_text))
+    
+    # Rebuild the content once with all fixes applied; labels are kept as-is,
+    # so each fix only spans the text after its label
+    fixed_content = _apply_replacements(content, replacements)
     
     # Apply document balancing for multi-draft documents
     balanced_content, balance_violations = balance_document_sections(fixed_content)
@@ -117,20 +172,40 @@ def validate_and_fix_proposal(content):
     
     return balanced_content, violations
 
+def _draft_section_spans(text):
+    """
+    Return (start, end) spans of "Draft N" sections found with str.find
+    Each section runs to the next "Draft N" marker; the last one stops
+    before a single trailing newline, as `$` did in the original regex
+    """
+    starts = []
+    position = text.find('Draft ')
+    while position != -1:
+        digit = position + 6
+        if digit < len(text) and text[digit].isdecimal():
+            starts.append(position)
+        position = text.find('Draft ', digit)
+    
+    if not starts:
+        return []
+    
+    last_end = len(text) - 1 if text.endswith('\n') else len(text)
+    return list(zip(starts, starts[1:] + [last_end]))
+
 def balance_document_sections(text):
     """
     Balance em dashes across document sections (Draft 1, Draft 2, etc.)
     Integrated from final_balance.py functionality
     """
     violations = []
-    processed_text = text
+    replacements = []
     
-    # Check for draft sections
-    if 'Draft ' in text:
+    # Check for draft sections; a section can only exceed the limit if the
+    # whole document does, so one count rules out the common case
+    if 'Draft ' in text and text.count('—') > 2:
         # Find all draft sections
-        draft_sections = re.findall(r'(Draft \d+.*?)(?=Draft \d+|$)', text, re.DOTALL)
-        
-        for i, section in enumerate(draft_sections):
+        for i, (start, end) in enumerate(_draft_section_spans(text)):
+            section = text[start:end]
             draft_number = i + 1
             em_count = section.count('—')
             
@@ -139,16 +214,17 @@ def balance_document_sections(text):
                 
                 # Apply specific reduction patterns for this draft
                 reduced_section = reduce_em_dashes_in_section(section, 2)
-                processed_text = processed_text.replace(section, reduced_section, 1)
+                replacements.append((start, end, reduced_section))
     
-    return processed_text, violations
+    return _apply_replacements(text, replacements), violations
 
 def reduce_em_dashes_in_section(section_text, target_max=2):
     """
     Reduce em dashes in a specific section to target maximum
     Uses context-aware replacement strategies from final_balance.py
     """
-    if section_text.count('—') <= target_max:
+    current_count = section_text.count('—')
+    if current_count <= target_max:
         return section_text
     
     processed_section = section_text
@@ -164,36 +240,38 @@ def reduce_em_dashes_in_section(section_text, target_max=2):
     for old_pattern, new_pattern in replacements_to_make:
         if old_pattern in processed_section:
             processed_section = processed_section.replace(old_pattern, new_pattern, 1)
+            # Track the count from the swapped phrases instead of rescanning
+            current_count -= old_pattern.count('—') - new_pattern.count('—')
             # Check if we've reached target
-            if processed_section.count('—') <= target_max:
+            if current_count <= target_max:
                 break
     
     # If still over limit, apply general reduction
-    current_count = processed_section.count('—')
     if current_count > target_max:
         # Find remaining em dashes and convert the least impactful ones
-        em_matches = list(re.finditer(r'([^—\n]{10,50})\s*—\s*([^—\n]{10,50})', processed_section))
+        em_matches = list(_EM_DASH_CONTEXT_RE.finditer(processed_section))
         
-        # Sort by potential impact (shorter contexts = less impactful)
+        # Sort by potential impact (shorter contexts = less impactful); each
+        # match holds exactly one em dash, so convert just the excess
         em_matches.sort(key=lambda m: len(m.group(0)))
+        selected = {m.start() for m in em_matches[:current_count - target_max]}
         
-        for match in em_matches:
-            if processed_section.count('—') <= target_max:
-                break
-                
-            old_text = match.group(0)
+        def replace_em_dash(match):
+            if match.start() not in selected:
+                return match.group(0)
+            
             left_part = match.group(1).strip()
             right_part = match.group(2).strip()
             
             # Choose replacement intelligently
             if right_part and right_part[0].isupper():
-                new_text = f"{left_part}. {right_part}"
+                return f"{left_part}. {right_part}"
             elif any(word in right_part.lower()[:15] for word in ['and', 'but', 'which', 'that']):
-                new_text = f"{left_part}, {right_part}"
+                return f"{left_part}, {right_part}"
             else:
-                new_text = f"{left_part}, {right_part}"
-            
-            processed_section = processed_section.replace(old_text, new_text, 1)
+                return f"{left_part}, {right_part}"
+        
+        processed_section = _EM_DASH_CONTEXT_RE.sub(replace_em_dash, processed_section)
     
     return processed_section
 
@@ -9,11 +9,64 @@ import sys
 import json
 import os
 import re
-import requests
-from typing import Dict, List, Optional, Tuple
-from bs4 import BeautifulSoup
+import mmap
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Union
 import argparse
-from urllib.parse import urljoin, urlparse
+from concurrent.futures import ProcessPoolExecutor
+
+# Question files are read in 64KB blocks instead of being slurped whole
+READ_BUFFER_SIZE = 64 * 1024
+
+# Extracted questions keyed by (abspath, mtime_ns, size); an edited file
+# gets a new key, so hook re-runs on unchanged files skip re-parsing.
+# Least recently used entries are evicted first.
+EXTRACTION_CACHE_SIZE = 128
+_extraction_cache: "OrderedDict[Tuple[str, int, int], List[str]]" = OrderedDict()
+_extraction_cache_lock = threading.Lock()
+
+# pyahocorasick scans text for every phrase in a single linear pass
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# ijson streams large JSON question catalogs without loading the whole document
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# google-re2 matches large alternations in guaranteed linear time
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+def _compile_scanner(pattern: str):
+    """Compile a case-insensitive scan pattern with RE2 when available, else stdlib re"""
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile(f"(?i){pattern}")
+        except re2.error:
+            pass  # Constructs RE2 does not support fall back to the stdlib engine
+    
+    return re.compile(pattern, re.IGNORECASE)
+
+def _build_phrase_automaton(phrases: List[str]):
+    """Build an Aho-Corasick automaton mapping lowercased phrases to their index"""
+    if not AHOCORASICK_AVAILABLE or not phrases:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for index, phrase in enumerate(phrases):
+        automaton.add_word(phrase.lower(), index)
+    automaton.make_automaton()
+    return automaton
 
 class QuestionVerificationResult:
     """Result of question verification with specific issues found"""
@@ -42,7 +95,8 @@ class QuestionVerificationResult:
             "errors": self.errors,
             "warnings": self.warnings,
             "suggestions": self.suggestions,
-            "verification_rate": f"{self.verified_questions}/{self.total_questions}"
+            "verified_questions": self.verified_questions,
+            "total_questions": self.total_questions
         }
 
 class QuestionAccuracyChecker:
@@ -101,6 +155,34 @@ class QuestionAccuracyChecker:
             "ai-powered tools",
             "ontoedit ai"
         ]
+        
+        # Project-specific terms that real funders would not use
+        self.project_terms = ['divinity school', 'ontoedit', 'endemic', 'four powers', 'sacred societies']
+        
+        self._red_flag_phrases_lower = [phrase.lower() for phrase in self.red_flag_phrases]
+        
+        # Multi-phrase automatons (None when pyahocorasick is not installed)
+        self._red_flag_automaton = _build_phrase_automaton(self.red_flag_phrases)
+        self._project_term_automaton = _build_phrase_automaton(self.project_terms)
+        
+        # Compile patterns once rather than on every question
+        self._generic_patterns = [re.compile(p, re.IGNORECASE) for p in self.generic_patterns]
+        
+        # One alternation over every generic pattern and red flag phrase, used
+        # to clear questions that match none of them in a single scan
+        self._combined = _compile_scanner(
+            "|".join([f"(?:{p})" for p in self.generic_patterns] +
+                     [re.escape(phrase) for phrase in self._red_flag_phrases_lower])
+        )
+        self._python_gq_pattern = re.compile(r'GrantQuestion\([^,]*,\s*["\']([^"\']+)["\']', re.MULTILINE | re.DOTALL)
+        self._python_gq_bytes_pattern = re.compile(rb'GrantQuestion\([^,]*,\s*["\']([^"\']+)["\']', re.MULTILINE | re.DOTALL)
+        # A question mark or an instruction verb, checked against lowercased text
+        self._is_questionlike = re.compile(r"\?|describe|explain|provide|submit")
+        # "1. Question?", "1) Question?" or "Q1: Question", one per line
+        self._text_question_pattern = re.compile(
+            r'^[^\S\n]*(?:\d+[.)][^\S\n]+(?P<numbered>.+\?)|Q\d+:[^\S\n]*(?P<labeled>.*\S))[^\S\n]*$',
+            re.MULTILINE | re.IGNORECASE
+        )
     
     def verify_questions_file(self, file_path: str) -> QuestionVerificationResult:
         """Verify questions from a file (Python, JSON, or text)"""
@@ -134,33 +216,80 @@ class QuestionAccuracyChecker:
         questions = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            stat = os.stat(file_path)
+            cache_key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+            with _extraction_cache_lock:
+                cached = _extraction_cache.get(cache_key)
+                if cached is not None:
+                    _extraction_cache.move_to_end(cache_key)
+                    return list(cached)
             
-            # If it's Python code with GrantQuestion objects
-            if file_path.endswith('.py') and 'GrantQuestion' in content:
-                questions = self._extract_from_python_code(content)
+            questions = self._read_questions_from_file(file_path)
             
-            # If it's JSON
-            elif file_path.endswith('.json'):
-                questions = self._extract_from_json(content)
-            
-            # Plain text - look for question patterns
-            else:
-                questions = self._extract_from_text(content)
+            with _extraction_cache_lock:
+                _extraction_cache[cache_key] = list(questions)
+                _extraction_cache.move_to_end(cache_key)
+                if len(_extraction_cache) > EXTRACTION_CACHE_SIZE:
+                    _extraction_cache.popitem(last=False)
             
         except Exception as e:
             print(f"Error reading file {file_path}: {e}", file=sys.stderr)
         
         return questions
     
+    def _read_questions_from_file(self, file_path: str) -> List[str]:
+        """Read and parse questions from a file based on its extension"""
+        # If it's Python code with GrantQuestion objects, scan it in place
+        if file_path.endswith('.py'):
+            python_questions = self._extract_from_python_file(file_path)
+            if python_questions is not None:
+                return python_questions
+        
+        # If it's JSON, parse the raw bytes without building a str copy
+        if file_path.endswith('.json'):
+            with open(file_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+                if IJSON_AVAILABLE:
+                    streamed = self._extract_from_json_stream(f)
+                    if streamed is not None:
+                        return streamed
+                    f.seek(0)
+                return self._extract_from_json(f.read())
+        
+        # Plain text - look for question patterns
+        with open(file_path, 'r', encoding='utf-8', buffering=READ_BUFFER_SIZE) as f:
+            return self._extract_from_text_stream(f)
+    
     def _extract_from_python_code(self, content: str) -> List[str]:
         """Extract questions from Python code with GrantQuestion objects"""
-        questions = []
+        # Match GrantQuestion constructor calls
+        matches = self._python_gq_pattern.findall(content)
+        return self._clean_python_questions(matches)
+    
+    def _extract_from_python_file(self, file_path: str) -> Optional[List[str]]:
+        """
+        Extract questions from a Python file without reading it into a string
+        The file is memory-mapped and only captured question text is decoded.
+        Returns None when the file contains no GrantQuestion calls.
+        """
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b'GrantQuestion') == -1:
+                    return None
+                
+                # Decode each capture and normalize newlines like text mode would
+                matches = [
+                    match.group(1).decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+                    for match in self._python_gq_bytes_pattern.finditer(mm)
+                ]
         
-        # Pattern to match GrantQuestion constructor calls
-        pattern = r'GrantQuestion\([^,]*,\s*["\']([^"\']+)["\']'
-        matches = re.findall(pattern, content, re.MULTILINE | re.DOTALL)
+        return self._clean_python_questions(matches)
+    
+    def _clean_python_questions(self, matches: List[str]) -> List[str]:
+        """Normalize captured GrantQuestion text and drop very short matches"""
+        questions = []
         
         for match in matches:
             # Clean up the question text
@@ -170,7 +299,7 @@ class QuestionAccuracyChecker:
         
         return questions
     
-    def _extract_from_json(self, content: str) -> List[str]:
+    def _extract_from_json(self, content: Union[str, bytes]) -> List[str]:
         """Extract questions from JSON structure"""
         questions = []
         
@@ -179,58 +308,119 @@ class QuestionAccuracyChecker:
             
             # Look for various JSON structures
             if isinstance(data, list):
-                for item in data:
-                    if isinstance(item, dict):
-                        question = item.get('question', item.get('question_text', ''))
-                        if question:
-                            questions.append(question)
+                questions = [question for question in map(self._question_from_json_item, data) if question]
             elif isinstance(data, dict):
                 # Look for questions in various keys
-                for key, value in data.items():
-                    if 'question' in key.lower() and isinstance(value, str):
-                        questions.append(value)
+                questions = [value for key, value in data.items()
+                             if isinstance(value, str) and 'question' in key.lower()]
         
         except json.JSONDecodeError:
             pass
         
         return questions
     
+    def _extract_from_json_stream(self, stream) -> Optional[List[str]]:
+        """
+        Extract questions from a binary JSON stream with ijson
+        Array items are built one at a time, and for object roots only keys
+        mentioning 'question' are kept. Returns None when the document cannot
+        be streamed so the caller can fall back to a full json parse.
+        """
+        # Peek at the first significant byte to find the root type
+        first = stream.read(1)
+        while first in (b' ', b'\t', b'\r', b'\n'):
+            first = stream.read(1)
+        stream.seek(0)
+        
+        questions = []
+        try:
+            if first == b'[':
+                for item in ijson.items(stream, 'item', use_float=True):
+                    question = self._question_from_json_item(item)
+                    if question:
+                        questions.append(question)
+            elif first == b'{':
+                # Collect into a dict so duplicate keys resolve like json.loads
+                candidates = {}
+                for key, value in ijson.kvitems(stream, '', use_float=True):
+                    if 'question' in key.lower():
+                        candidates[key] = value
+                questions = [value for value in candidates.values() if isinstance(value, str)]
+            else:
+                return None
+        except Exception:
+            return None
+        
+        return questions
+    
+    def _question_from_json_item(self, item):
+        """Return the question text from one JSON array item, if any"""
+        if isinstance(item, dict):
+            # Only fall back to question_text when the question key is absent
+            if 'question' in item:
+                return item['question']
+            return item.get('question_text', '')
+        return None
+    
+    def _extract_from_text_stream(self, stream) -> List[str]:
+        """Extract questions from a text stream one block of whole lines at a time"""
+        questions = []
+        pending = ''
+        
+        while True:
+            chunk = stream.read(READ_BUFFER_SIZE)
+            if not chunk:
+                break
+            
+            # Only scan complete lines; carry the partial last line forward
+            pending += chunk
+            cut = pending.rfind('\n') + 1
+            if cut:
+                questions.extend(self._extract_from_text(pending[:cut]))
+                pending = pending[cut:]
+        
+        if pending:
+            questions.extend(self._extract_from_text(pending))
+        
+        return questions
+    
     def _extract_from_text(self, content: str) -> List[str]:
         """Extract questions from plain text"""
         questions = []
         
         # Look for numbered questions
-        patterns = [
-            r'^\d+\.\s+(.+\?)$',  # "1. Question?"
-            r'^Q\d+:\s*(.+)$',    # "Q1: Question"
-            r'^\d+\)\s+(.+\?)$',  # "1) Question?"
-        ]
-        
-        lines = content.split('\n')
-        for line in lines:
-            line = line.strip()
-            for pattern in patterns:
-                match = re.match(pattern, line, re.IGNORECASE)
-                if match:
-                    questions.append(match.group(1).strip())
+        for match in self._text_question_pattern.finditer(content):
+            question = match.group('numbered') or match.group('labeled')
+            questions.append(question.strip())
         
         return questions
     
     def _verify_single_question(self, question_text: str, result: QuestionVerificationResult):
         """Verify a single question for accuracy indicators"""
         question_lower = question_text.lower()
+        generic_count = 0
         
-        # Check for red flag phrases
-        for phrase in self.red_flag_phrases:
-            if phrase.lower() in question_lower:
+        # An alternation only reports one branch per position, so on a hit
+        # the individual checks below still run to find every match
+        if self._combined.search(question_lower):
+            # Check for red flag phrases
+            if self._red_flag_automaton is not None:
+                found = {index for _, index in self._red_flag_automaton.iter(question_lower)}
+                red_flags = [phrase for index, phrase in enumerate(self.red_flag_phrases) if index in found]
+            else:
+                red_flags = [phrase for phrase, phrase_lower in zip(self.red_flag_phrases, self._red_flag_phrases_lower)
+                             if phrase_lower in question_lower]
+            
+            for phrase in red_flags:
                 result.add_error(f"Question contains red flag phrase: '{phrase}'")
                 result.add_suggestion("Use exact questions from official RFPs only")
-        
-        # Check for generic patterns
-        generic_count = 0
-        for pattern in self.generic_patterns:
-            if re.search(pattern, question_lower):
-                generic_count += 1
+            
+            # Check for generic patterns; two hits already meet the threshold
+            for pattern in self._generic_patterns:
+                if pattern.search(question_lower):
+                    generic_count += 1
+                    if generic_count >= 2:
+                        break
         
         if generic_count >= 2:
             result.add_warning(f"Question appears to be generic/fabricated: '{question_text[:60]}...'")
@@ -240,89 +430,127 @@ class QuestionAccuracyChecker:
         if len(question_text) > 300:
             result.add_warning("Unusually long question - may be composite or fabricated")
         
-        if '?' not in question_text and not any(word in question_lower for word in ['describe', 'explain', 'provide', 'submit']):
+        if not self._is_questionlike.search(question_lower):
             result.add_warning("Text may not be a proper question")
     
     def _check_overall_patterns(self, questions: List[str], result: QuestionVerificationResult):
         """Check patterns across all questions"""
+        # Standard patterns that mark a question as potentially verified
+        standard_question_indicators = (
+            'budget', 'timeline', 'personnel', 'evaluation', 'dissemination',
+            'collaboration', 'institutional', 'biographical', 'summary'
+        )
+        automaton = self._project_term_automaton
+        
+        # Gather every per-question count in a single pass
+        starts_with_how = starts_with_what = term_mentions = verified = 0
+        for question in questions:
+            question_lower = question.lower()
+            
+            if question_lower.startswith('how'):
+                starts_with_how += 1
+            elif question_lower.startswith('what'):
+                starts_with_what += 1
+            
+            if automaton is not None:
+                term_mentions += len({index for _, index in automaton.iter(question_lower)})
+            else:
+                for term in self.project_terms:
+                    if term in question_lower:
+                        term_mentions += 1
+            
+            for indicator in standard_question_indicators:
+                if indicator in question_lower:
+                    verified += 1
+                    break
         
         # Check for suspiciously uniform question structure
         if len(questions) >= 3:
-            starts_with_how = sum(1 for q in questions if q.lower().startswith('how'))
-            starts_with_what = sum(1 for q in questions if q.lower().startswith('what'))
-            
             if starts_with_how + starts_with_what >= len(questions) * 0.8:
                 result.add_warning("Questions follow suspiciously uniform pattern")
                 result.add_suggestion("Real applications usually have varied question types")
         
         # Check for project-specific jargon across questions
-        project_terms = ['divinity school', 'ontoedit', 'endemic', 'four powers', 'sacred societies']
-        term_mentions = sum(1 for q in questions for term in project_terms if term in q.lower())
-        
         if term_mentions > 0:
             result.add_error("Questions contain project-specific terms (likely fabricated)")
             result.add_suggestion("Real grant questions should be generic and funder-focused")
         
-        # Mark some questions as potentially verified based on standard patterns
-        standard_question_indicators = [
-            'budget', 'timeline', 'personnel', 'evaluation', 'dissemination',
-            'collaboration', 'institutional', 'biographical', 'summary'
-        ]
-        
-        for question in questions:
-            for indicator in standard_question_indicators:
-                if indicator in question.lower():
-                    result.verified_questions += 1
-                    break
+        result.verified_questions += verified
 
 def validate_questions_file(file_path: str) -> QuestionVerificationResult:
     """Main validation function for use by hooks"""
     checker = QuestionAccuracyChecker()
     return checker.verify_questions_file(file_path)
 
+# Checker built once per worker process by _init_worker_checker
+_worker_checker = None
+
+def _init_worker_checker():
+    """Build one checker per worker so patterns are compiled once per process"""
+    global _worker_checker
+    _worker_checker = QuestionAccuracyChecker()
+
+def _validate_in_worker(file_path: str) -> QuestionVerificationResult:
+    """Validate one file with the worker's shared checker"""
+    return _worker_checker.verify_questions_file(file_path)
+
+def validate_questions_files(file_paths: List[str], max_workers: Optional[int] = None) -> List[QuestionVerificationResult]:
+    """Validate several question files, spreading them across worker processes"""
+    if len(file_paths) < 2:
+        return [validate_questions_file(file_path) for file_path in file_paths]
+    
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(),
+                                 initializer=_init_worker_checker) as executor:
+            return list(executor.map(_validate_in_worker, file_paths))
+    except Exception as e:
+        print(f"Parallel validation failed, falling back to serial: {e}", file=sys.stderr)
+        checker = QuestionAccuracyChecker()
+        return [checker.verify_questions_file(file_path) for file_path in file_paths]
+
 def main():
     """Main function for command line usage"""
     parser = argparse.ArgumentParser(description="Verify grant question accuracy")
-    parser.add_argument("--validate", required=True, help="File containing questions to validate")
+    parser.add_argument("--validate", required=True, nargs='+', help="File(s) containing questions to validate")
     parser.add_argument("--strict", action="store_true", help="Treat warnings as errors")
     parser.add_argument("--quiet", action="store_true", help="Suppress output except errors")
     parser.add_argument("--source-required", action="store_true", help="Require source verification")
     
     args = parser.parse_args()
     
-    result = validate_questions_file(args.validate)
+    results = validate_questions_files(args.validate)
+    failed = False
     
-    if not args.quiet:
-        print("QUESTION ACCURACY CHECKER RESULTS:")
-        print("="*50)
-        
-        if result.errors:
-            print("❌ ERRORS:")
-            for error in result.errors:
-                print(f"  • {error}")
-        
-        if result.warnings:
-            print("⚠️  WARNINGS:")
-            for warning in result.warnings:
-                print(f"  • {warning}")
-        
-        if result.suggestions:
-            print("💡 SUGGESTIONS:")
-            for suggestion in result.suggestions:
-                print(f"  • {suggestion}")
-        
-        print(f"\n📊 Verification Rate: {result.verified_questions}/{result.total_questions}")
-        print(f"✅ Valid: {result.is_valid}")
+    # Build the whole report and write it once at the end
+    lines = ["QUESTION ACCURACY CHECKER RESULTS:", "="*50]
+    
+    for file_path, result in zip(args.validate, results):
+        if len(args.validate) > 1:
+            lines.append(f"\n📄 {file_path}")
+        
+        for header, messages in (("❌ ERRORS:", result.errors),
+                                 ("⚠️  WARNINGS:", result.warnings),
+                                 ("💡 SUGGESTIONS:", result.suggestions)):
+            if messages:
+                lines.append(header)
+                lines.extend(f"  • {message}" for message in messages)
+        
+        lines.append(f"\n📊 Verification Rate: {result.verified_questions}/{result.total_questions}")
+        lines.append(f"✅ Valid: {result.is_valid}")
+        
+        if not result.is_valid or (args.strict and result.warnings):
+            failed = True
     
     # Exit with error code if validation failed
-    if not result.is_valid or (args.strict and result.warnings):
-        if not args.quiet:
-            print("\n🚫 VALIDATION FAILED - Questions appear to be inaccurate or fabricated")
-        sys.exit(1)
+    if failed:
+        lines.append("\n🚫 VALIDATION FAILED - Questions appear to be inaccurate or fabricated")
+    else:
+        lines.append("\n✅ VALIDATION PASSED")
     
     if not args.quiet:
-        print("\n✅ VALIDATION PASSED")
-    sys.exit(0)
+        sys.stdout.write("\n".join(lines) + "\n")
+    
+    sys.exit(1 if failed else 0)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
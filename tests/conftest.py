@@ -0,0 +1,23 @@
+"""
+Shared pytest configuration for the grant agent test suite
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the repository root importable once per session
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture(scope="module")
+def verifier():
+    """One GrantVerifier shared by every test in a module"""
+    from grant_verifier import GrantVerifier
+    return GrantVerifier()
+
+
+def pytest_configure(config):
+    """Register custom markers"""
+    config.addinivalue_line("markers", "slow: large-input tests (deselect with -m 'not slow')")
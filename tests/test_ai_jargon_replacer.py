@@ -5,60 +5,50 @@ Tests pattern replacement, em dash handling, and style analysis
 """
 
 import pytest
-import sys
-import os
-import tempfile
 import json
-from unittest.mock import patch, MagicMock
-
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from ai_jargon_replacer import AIJargonReplacer, StyleProfile, JargonMatch
 
 
+@pytest.fixture(scope="session")
+def sample_config():
+    """Create a sample configuration for testing"""
+    config = {
+        "overused_phrases": {
+            "leverage": ["use", "utilize", "apply"],
+            "groundbreaking": ["new", "novel", "first"],
+            "paradigm": ["model", "framework", "approach"]
+        },
+        "typography_rules": {
+            "em_dash_patterns": {
+                "definition_patterns": [
+                    {
+                        "pattern": "OntoEdit AI[\"']?\\s*[—,]\\s*the first tool that",
+                        "replacement": "OntoEdit AI. The first tool that",
+                        "description": "Dramatic pause with period"
+                    }
+                ],
+                "hyphenation_fixes": [
+                    {"from": "co — founder", "to": "co-founder"}
+                ]
+            }
+        },
+        "em_dash_threshold": 2
+    }
+    return config
+
+
+@pytest.fixture(scope="session")
+def temp_config_file(tmp_path_factory, sample_config):
+    """Write the sample config once and share it across tests"""
+    config_path = tmp_path_factory.mktemp("config") / "jargon_config.json"
+    config_path.write_text(json.dumps(sample_config, indent=2))
+    return str(config_path)
+
+
 class TestAIJargonReplacer:
     """Test AI Jargon Replacer functionality"""
     
-    @pytest.fixture
-    def sample_config(self):
-        """Create a sample configuration for testing"""
-        config = {
-            "overused_phrases": {
-                "leverage": ["use", "utilize", "apply"],
-                "groundbreaking": ["new", "novel", "first"],
-                "paradigm": ["model", "framework", "approach"]
-            },
-            "typography_rules": {
-                "em_dash_patterns": {
-                    "definition_patterns": [
-                        {
-                            "pattern": "OntoEdit AI[\"']?\\s*[—,]\\s*the first tool that",
-                            "replacement": "OntoEdit AI. The first tool that",
-                            "description": "Dramatic pause with period"
-                        }
-                    ],
-                    "hyphenation_fixes": [
-                        {"from": "co — founder", "to": "co-founder"}
-                    ]
-                }
-            },
-            "em_dash_threshold": 2
-        }
-        return config
-    
-    @pytest.fixture
-    def temp_config_file(self, sample_config):
-        """Create a temporary config file"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(sample_config, f, indent=2)
-            temp_path = f.name
-        
-        yield temp_path
-        
-        # Cleanup
-        os.unlink(temp_path)
-    
     def test_initialization(self, temp_config_file):
         replacer = AIJargonReplacer(temp_config_file)
         assert replacer.config is not None
@@ -203,22 +193,18 @@ class TestErrorHandling:
         assert isinstance(result, str)
         assert isinstance(matches, list)
     
-    def test_malformed_config(self):
+    def test_malformed_config(self, tmp_path):
         # Create malformed config file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            f.write('{"invalid": json}')  # Invalid JSON
-            temp_path = f.name
-        
-        try:
-            replacer = AIJargonReplacer(temp_path)
-            text = "Test text"
-            result, matches = replacer.analyze_text(text)
-            
-            # Should handle gracefully
-            assert isinstance(result, str)
-            assert isinstance(matches, list)
-        finally:
-            os.unlink(temp_path)
+        temp_path = tmp_path / "malformed.json"
+        temp_path.write_text('{"invalid": json}')  # Invalid JSON
+        
+        replacer = AIJargonReplacer(str(temp_path))
+        text = "Test text"
+        result, matches = replacer.analyze_text(text)
+        
+        # Should handle gracefully
+        assert isinstance(result, str)
+        assert isinstance(matches, list)
     
     def test_empty_text(self, temp_config_file):
         replacer = AIJargonReplacer(temp_config_file)
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Unit tests for utils/cache_manager.py
+Tests disk persistence, expiry, the background writer and the async facade
+"""
+
+import asyncio
+import hashlib
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from utils import cache_manager
+from utils.cache_manager import (
+    AsyncCacheManager, CacheEntry, CacheType, IntelligentCacheManager,
+    MMAP_THRESHOLD, _make_full_key
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return str(tmp_path / "cache")
+
+
+@pytest.fixture
+def cache(cache_dir):
+    with IntelligentCacheManager(cache_dir=cache_dir) as manager:
+        yield manager
+
+
+def reopen(cache_dir):
+    """A second manager over the same directory, so reads come from disk"""
+    return IntelligentCacheManager(cache_dir=cache_dir)
+
+
+class TestPersistence:
+    """Entries written by one manager are readable by the next"""
+
+    @pytest.mark.parametrize("data", [
+        {"title": "Grant", "amount": 100000},    # JSON record
+        ("tuple", {1, 2}),                       # pickled entry
+        "<html>" + "grant text " * 2000,         # compressed
+        b"\x00\x01" * MMAP_THRESHOLD,            # raw blob
+    ])
+    def test_round_trip_through_fresh_instance(self, cache, cache_dir, data):
+        cache.set("key", data)
+        cache.flush()
+
+        with reopen(cache_dir) as fresh:
+            assert fresh.get("key") == data
+
+    def test_overwrites_coalesce_to_latest_value(self, cache, cache_dir):
+        for version in range(50):
+            cache.set("key", version)
+        cache.flush()
+
+        with reopen(cache_dir) as fresh:
+            assert fresh.get("key") == 49
+
+    def test_expired_entry_not_returned(self, cache, cache_dir, monkeypatch):
+        cache.set("key", "value", ttl_hours=1)
+        cache.flush()
+
+        later = time.time() + 2 * 3600
+        monkeypatch.setattr(cache_manager.time, "time", lambda: later)
+
+        assert cache.get("key") is None
+        with reopen(cache_dir) as fresh:
+            assert fresh.get("key") is None
+
+    def test_legacy_file_migrated(self, cache_dir):
+        # Older versions stored an untagged pickle at <type>/<md5>.pkl
+        full_key = _make_full_key("old", CacheType.WEB_CONTENT)
+        entry = CacheEntry(key="old", data="legacy value", cache_type=CacheType.WEB_CONTENT,
+                           created_at=cache_manager.datetime.now(), expires_at=None)
+        with reopen(cache_dir) as manager:
+            manager.flush()
+            legacy_path = manager.cache_dir / CacheType.WEB_CONTENT.value / f"{hashlib.md5(full_key.encode()).hexdigest()}.pkl"
+            legacy_path.write_bytes(pickle.dumps(entry))
+
+            assert manager.get("old") == "legacy value"
+            assert not legacy_path.exists()
+
+        with reopen(cache_dir) as fresh:
+            assert fresh.get("old") == "legacy value"
+
+
+class TestPendingWrites:
+    """delete/clear must win over writes still waiting for the writer thread"""
+
+    @pytest.fixture
+    def held_writer(self, cache):
+        """Hold the writer before it saves anything until the test releases it"""
+        release = threading.Event()
+        write_pending = cache._write_pending
+
+        def blocked_write(mem_key):
+            release.wait()
+            write_pending(mem_key)
+
+        cache._write_pending = blocked_write
+        yield release
+        release.set()
+
+    def test_delete_while_pending(self, cache, cache_dir, held_writer):
+        cache.set("kept", "value")
+        cache.set("deleted", "value")
+        cache.delete("deleted")
+        assert cache.get("deleted") is None
+
+        held_writer.set()
+        cache.flush()
+
+        with reopen(cache_dir) as fresh:
+            assert fresh.get("kept") == "value"
+            assert fresh.get("deleted") is None
+
+    def test_clear_while_pending(self, cache, cache_dir, held_writer):
+        cache.set("first", "value")
+        cache.set("second", "value", CacheType.SEARCH_RESULTS)
+        cache.clear()
+
+        held_writer.set()
+        cache.flush()
+
+        with reopen(cache_dir) as fresh:
+            assert fresh.get("first") is None
+            assert fresh.get("second", CacheType.SEARCH_RESULTS) is None
+
+
+class TestReadHelpers:
+    """get_view and get_or_load"""
+
+    def test_get_view_maps_large_bytes(self, cache, cache_dir):
+        payload = bytes(range(256)) * (MMAP_THRESHOLD // 256 + 1)
+        cache.set("blob", payload, CacheType.SCRAPED_DATA)
+        cache.flush()
+
+        with reopen(cache_dir) as fresh:
+            view = fresh.get_view("blob")
+            assert isinstance(view, memoryview)
+            assert view.readonly
+            assert view == payload
+            view.release()
+
+    def test_get_view_non_bytes(self, cache):
+        cache.set("text", "not bytes", CacheType.SCRAPED_DATA)
+        assert cache.get_view("text") is None
+        assert cache.get_view("missing") is None
+
+    def test_get_or_load_calls_loader_once(self, cache):
+        calls = []
+        start = threading.Barrier(8)
+
+        def loader():
+            calls.append(1)
+            time.sleep(0.05)
+            return {"loaded": True}
+
+        def load():
+            start.wait()
+            return cache.get_or_load("shared", loader)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: load(), range(8)))
+
+        assert results == [{"loaded": True}] * 8
+        assert len(calls) == 1
+        assert cache.get_or_load("shared", loader) == {"loaded": True}
+        assert len(calls) == 1
+
+    def test_get_or_load_propagates_errors(self, cache):
+        def loader():
+            raise ValueError("fetch failed")
+
+        with pytest.raises(ValueError):
+            cache.get_or_load("broken", loader)
+        assert cache.get_or_load("broken", lambda: "recovered") == "recovered"
+
+
+class TestLifecycle:
+    """Closing managers and stopping their writer threads"""
+
+    def test_context_manager_stops_writer(self, cache_dir):
+        with IntelligentCacheManager(cache_dir=cache_dir) as manager:
+            manager.set("key", "value")
+
+        assert not manager._writer.is_alive()
+        with reopen(cache_dir) as fresh:
+            assert fresh.get("key") == "value"
+
+    def test_startup_sweep_finished_before_stats_and_clear(self, cache, cache_dir, monkeypatch):
+        for index in range(20):
+            cache.set(f"key{index}", "value", ttl_hours=1)
+        cache.close()
+
+        later = time.time() + 2 * 3600
+        monkeypatch.setattr(cache_manager.time, "time", lambda: later)
+
+        with reopen(cache_dir) as fresh:
+            assert fresh.get_stats()["cache_types"][CacheType.WEB_CONTENT.value] == 0
+        with reopen(cache_dir) as fresh:
+            fresh.clear()
+
+    def test_async_get_set(self, cache):
+        async def run():
+            async_cache = AsyncCacheManager(cache)
+            await async_cache.aset("key", {"async": True})
+            value = await async_cache.aget("key")
+            await async_cache.adelete("key")
+            missing = await async_cache.aget("key")
+            await async_cache.aclose()
+            return value, missing
+
+        assert asyncio.run(run()) == ({"async": True}, None)
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Unit tests for utils/logger.py
+Tests that records from forked worker processes still reach the handlers
+"""
+
+import multiprocessing
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(),
+                    reason="fork start method not available")
+def test_forked_worker_logs_reach_console_and_file(tmp_path):
+    # Run in a fresh interpreter so the logger is configured before the fork
+    script = textwrap.dedent("""
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        from utils.logger import GrantAgentLogger
+
+        logger = GrantAgentLogger().get_logger("fork_test")
+
+        def work(n):
+            logger.warning("worker warning %d", n)
+            return n
+
+        if __name__ == "__main__":
+            logger.warning("parent warning")
+            context = multiprocessing.get_context("fork")
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                assert list(pool.map(work, [1])) == [1]
+    """)
+    env = dict(os.environ, GRANT_LOG_DIR=str(tmp_path), LOG_LEVEL="WARNING")
+    completed = subprocess.run([sys.executable, "-c", script], cwd=REPO_ROOT, env=env,
+                               capture_output=True, text=True, timeout=60)
+
+    assert completed.returncode == 0, completed.stderr
+    assert "parent warning" in completed.stdout
+    assert "worker warning 1" in completed.stdout
+    log_text = (tmp_path / "system.log").read_text(encoding="utf-8")
+    assert "parent warning" in log_text
+    assert "worker warning 1" in log_text
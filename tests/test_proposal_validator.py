@@ -5,12 +5,6 @@ Tests word/character limits and document balancing functionality
 """
 
 import pytest
-import sys
-import os
-from unittest.mock import patch
-
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from proposal_validator import (
     count_characters, count_words, truncate_to_char_limit, 
@@ -88,6 +82,18 @@ class TestProposalValidation:
         proposal_text = proposal_in_fixed.split(":**")[1].strip()
         assert len(proposal_text.split()) <= 500
     
+    def test_multiple_sections_fixed(self):
+        # Each over-limit section should be fixed, not just the first one
+        long_tweet = "long words here " * 20
+        long_abstract = " ".join(["word"] * 300)
+        content = f"**Tweet <140:** {long_tweet}\n\n**Abstract:** {long_abstract}"
+        
+        fixed_content, violations = validate_and_fix_proposal(content)
+        
+        assert len(violations) == 2
+        abstract_text = fixed_content.split("**Abstract:")[1]
+        assert len(abstract_text.split()) <= 251  # 250 words plus the "**" marker
+    
     def test_no_violations(self):
         content = "**Tweet <140 chars:** Short tweet\n**Proposal <500 words:** Short proposal"
         fixed_content, violations = validate_and_fix_proposal(content)
@@ -125,6 +131,14 @@ Draft 2: Another draft — with multiple — em dash — problems here.
         assert "This has" in reduced
         assert "good style" in reduced
     
+    def test_reduce_em_dashes_repeated_phrases(self):
+        # Identical em dash phrases should each be counted and reduced
+        section = "the first sentence — the second sentence. " * 4
+        reduced = reduce_em_dashes_in_section(section, 2)
+        
+        assert reduced.count('—') == 2
+        assert reduced.count("the first sentence") == 4
+    
     def test_no_draft_sections(self):
         content = "Regular content with no draft sections."
         balanced_content, violations = balance_document_sections(content)
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Unit tests for question_accuracy_checker.py
+Tests question extraction from Python, JSON and text files, the
+extraction cache and result reporting
+"""
+
+import io
+import json
+import os
+
+import pytest
+
+import question_accuracy_checker
+from question_accuracy_checker import (
+    QuestionAccuracyChecker, QuestionVerificationResult, validate_questions_files
+)
+
+
+@pytest.fixture(scope="module")
+def checker():
+    return QuestionAccuracyChecker()
+
+
+@pytest.fixture(autouse=True)
+def empty_extraction_cache(monkeypatch):
+    """Give every test its own extraction cache"""
+    monkeypatch.setattr(question_accuracy_checker, "_extraction_cache",
+                        question_accuracy_checker.OrderedDict())
+
+
+class TestExtraction:
+    """Questions are extracted according to the file type"""
+
+    def test_python_grant_questions(self, checker, tmp_path):
+        source = tmp_path / "questions.py"
+        source.write_text(
+            'QUESTIONS = [\n'
+            '    GrantQuestion("q1", "What is the total project budget?"),\n'
+            "    GrantQuestion('q2',\n"
+            "                  'Describe the evaluation timeline'),\n"
+            '    GrantQuestion("q3", "Too short"),\n'
+            ']\n'
+        )
+
+        assert checker._extract_questions_from_file(str(source)) == [
+            "What is the total project budget?",
+            "Describe the evaluation timeline",
+        ]
+
+    def test_python_without_grant_questions_read_as_text(self, checker, tmp_path):
+        source = tmp_path / "notes.py"
+        source.write_text("# 1. What is the project summary?\n")
+        assert checker._extract_questions_from_file(str(source)) == []
+
+        source.write_text("1. What is the project summary?\n")
+        assert checker._extract_questions_from_file(str(source)) == ["What is the project summary?"]
+
+    def test_json_array(self, checker, tmp_path):
+        source = tmp_path / "questions.json"
+        source.write_text(json.dumps([
+            {"question": "What is the project budget?", "weight": 0.5},
+            {"question_text": "Who are the key personnel?"},
+            {"question": "", "question_text": "Ignored when question is present"},
+            "not an object",
+        ]))
+
+        assert checker._extract_questions_from_file(str(source)) == [
+            "What is the project budget?",
+            "Who are the key personnel?",
+        ]
+
+    def test_json_object(self, checker, tmp_path):
+        source = tmp_path / "questions.json"
+        source.write_text(json.dumps({
+            "question_1": "What is the project timeline?",
+            "Main_Question": "How will results be disseminated?",
+            "question_count": 2,
+            "title": "Not a question field",
+        }))
+
+        assert checker._extract_questions_from_file(str(source)) == [
+            "What is the project timeline?",
+            "How will results be disseminated?",
+        ]
+
+    def test_invalid_json(self, checker, tmp_path):
+        source = tmp_path / "broken.json"
+        source.write_text("[{not json")
+        assert checker._extract_questions_from_file(str(source)) == []
+
+    def test_json_stream_matches_full_parse(self, checker):
+        pytest.importorskip("ijson")
+        document = json.dumps([
+            {"question": "What is the project budget?", "amount": 1.25},
+            {"question_text": "Who are the key personnel?", "score": 1e3},
+        ]).encode()
+
+        streamed = checker._extract_from_json_stream(io.BytesIO(document))
+        assert streamed == checker._extract_from_json(document)
+
+    def test_text_questions(self, checker, tmp_path):
+        source = tmp_path / "questions.txt"
+        source.write_text(
+            "Application questions\n"
+            "1. What is the project summary?\n"
+            "  2) How will you evaluate outcomes?  \n"
+            "3. This line has no question mark\n"
+            "Q4: Provide a budget justification\n"
+            "Intro text. 5. Not at the start of a line?\n"
+        )
+
+        assert checker._extract_questions_from_file(str(source)) == [
+            "What is the project summary?",
+            "How will you evaluate outcomes?",
+            "Provide a budget justification",
+        ]
+
+    def test_text_questions_across_read_blocks(self, checker, tmp_path, monkeypatch):
+        # Lines split across read blocks are carried into the next block
+        monkeypatch.setattr(question_accuracy_checker, "READ_BUFFER_SIZE", 16)
+        lines = [f"{n}. What is milestone number {n}?" for n in range(1, 21)]
+        source = tmp_path / "questions.txt"
+        source.write_text("\n".join(lines))
+
+        assert checker._extract_questions_from_file(str(source)) == [line.split(". ", 1)[1] for line in lines]
+
+
+class TestExtractionCache:
+    """Extracted questions are reused until the file changes"""
+
+    def test_rewrite_invalidates(self, checker, tmp_path):
+        source = tmp_path / "questions.txt"
+        source.write_text("1. What is the project summary?\n")
+        assert checker._extract_questions_from_file(str(source)) == ["What is the project summary?"]
+
+        source.write_text("1. What is the budget?\n")
+        assert checker._extract_questions_from_file(str(source)) == ["What is the budget?"]
+
+    def test_same_size_rewrite_invalidates(self, checker, tmp_path):
+        source = tmp_path / "questions.txt"
+        source.write_text("1. What is plan A?\n")
+        first_stat = os.stat(source)
+        assert checker._extract_questions_from_file(str(source)) == ["What is plan A?"]
+
+        source.write_text("1. What is plan B?\n")
+        os.utime(source, ns=(first_stat.st_atime_ns, first_stat.st_mtime_ns + 1_000_000))
+        assert checker._extract_questions_from_file(str(source)) == ["What is plan B?"]
+
+    def test_cached_result_is_a_copy(self, checker, tmp_path):
+        source = tmp_path / "questions.txt"
+        source.write_text("1. What is the project summary?\n")
+        checker._extract_questions_from_file(str(source)).append("mutated")
+
+        assert checker._extract_questions_from_file(str(source)) == ["What is the project summary?"]
+
+    def test_least_recently_used_evicted(self, checker, tmp_path, monkeypatch):
+        monkeypatch.setattr(question_accuracy_checker, "EXTRACTION_CACHE_SIZE", 2)
+        paths = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / f"{name}.txt"
+            path.write_text(f"1. What is {name}?\n")
+            paths.append(str(path))
+
+        checker._extract_questions_from_file(paths[0])
+        checker._extract_questions_from_file(paths[1])
+        checker._extract_questions_from_file(paths[0])  # a becomes most recent
+        checker._extract_questions_from_file(paths[2])
+
+        cached_paths = [key[0] for key in question_accuracy_checker._extraction_cache]
+        assert cached_paths == [os.path.abspath(paths[0]), os.path.abspath(paths[2])]
+
+
+class TestResults:
+    """Verification results and their serialized form"""
+
+    def test_to_dict(self):
+        result = QuestionVerificationResult()
+        result.add_warning("Check this")
+        result.verified_questions = 1
+        result.total_questions = 2
+
+        assert result.to_dict() == {
+            "is_valid": True,
+            "errors": [],
+            "warnings": ["Check this"],
+            "suggestions": [],
+            "verified_questions": 1,
+            "total_questions": 2,
+        }
+
+    def test_verify_file_counts(self, checker, tmp_path):
+        source = tmp_path / "questions.txt"
+        source.write_text(
+            "1. What is the project budget?\n"
+            "2. Describe the consciousness studies component?\n"
+        )
+        data = checker.verify_questions_file(str(source)).to_dict()
+
+        assert data["is_valid"] is False
+        assert data["total_questions"] == 2
+        assert data["verified_questions"] == 1
+        assert any("red flag" in error for error in data["errors"])
+        assert type(data["verified_questions"]) is int
+
+    def test_missing_and_empty_files(self, checker, tmp_path):
+        missing = checker.verify_questions_file(str(tmp_path / "missing.txt"))
+        assert missing.is_valid is False
+
+        empty = tmp_path / "empty.txt"
+        empty.write_text("")
+        result = checker.verify_questions_file(str(empty))
+        assert result.is_valid is True
+        assert result.warnings == ["No questions found in file"]
+
+    def test_validate_several_files_in_order(self, checker, tmp_path):
+        paths = []
+        for index, question in enumerate(["What is the budget?", "Describe the epistemological clarity goals?"]):
+            path = tmp_path / f"questions{index}.txt"
+            path.write_text(f"1. {question}\n")
+            paths.append(str(path))
+
+        results = validate_questions_files(paths, max_workers=2)
+        assert [result.to_dict() for result in results] == [
+            checker.verify_questions_file(path).to_dict() for path in paths
+        ]
+        assert [result.is_valid for result in results] == [True, False]
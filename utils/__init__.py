@@ -2,15 +2,26 @@
 Utility modules for Endemic Grant Agent
 """
 
-from .logger import get_logger, log_function_start, log_function_end, log_processing_step, log_error_with_context, log_grant_processing, log_validation_result, log_performance_metric
+import importlib
 
 __all__ = [
     'get_logger',
-    'log_function_start', 
+    'log_function_start',
     'log_function_end',
     'log_processing_step',
     'log_error_with_context',
     'log_grant_processing',
     'log_validation_result',
     'log_performance_metric'
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    """Import utils.logger only when one of its helpers is first used (PEP 562)"""
+    if name in __all__:
+        value = getattr(importlib.import_module('.logger', __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -9,15 +9,95 @@ import json
 import pickle
 import hashlib
 import time
-from typing import Any, Dict, Optional, List, Union, Tuple
+import math
+import random
+import zlib
+import mmap
+import struct
+import queue
+import threading
+import weakref
+import functools
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, List, Union, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 import logging
 from enum import Enum
 
 from .logger import GrantAgentLogger
 
+# orjson writes JSON-native cache records much faster than pickle
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# zstd level 1 compresses cached HTML/JSON at close to memcpy speed
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# xxh3 derives cache keys and file names far faster than md5
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# The same URLs and keys are hashed on every get/set during a scrape
+@functools.lru_cache(maxsize=4096)
+def _hash_key(text: str) -> str:
+    """Hex digest used for cache keys and cache file names"""
+    encoded = text.encode('utf-8')
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_hexdigest(encoded)
+    return hashlib.md5(encoded).hexdigest()
+
+# One-byte format tag at the start of each cache file. Untagged files are
+# legacy pickles, whose stream starts with the PROTO opcode (0x80).
+# Compressed files wrap a complete tagged record behind their own tag.
+_FORMAT_JSON = b'J'
+_FORMAT_PICKLE = b'P'
+_FORMAT_ZSTD = b'Z'
+_FORMAT_ZLIB = b'D'
+# Raw blob: tag, little-endian uint32 header length, pickled CacheEntry
+# without its data, then the bytes payload itself (mappable in place)
+_FORMAT_RAW = b'R'
+_RAW_HEADER = struct.Struct('<I')
+
+def _expiring_file_name(file_key: str, expires_at_ts: Optional[float]) -> str:
+    """Cache file name carrying the entry's expiry (epoch seconds, 0 = never expires)"""
+    expires = math.ceil(expires_at_ts) if expires_at_ts is not None else 0
+    return f"{file_key}__{expires}.pkl"
+
+def _parse_file_expiry(file_name: str) -> Optional[int]:
+    """Expiry encoded by _expiring_file_name, or None for names without one"""
+    _, sep, expires = file_name[:-4].rpartition('__')
+    if not sep or not file_name.endswith('.pkl') or not expires.isdigit():
+        return None
+    return int(expires)
+
+# Serialized records larger than this are compressed when enabled
+COMPRESSION_THRESHOLD = 4096
+
+# Stampede control: TTLs get +/-10% jitter so entries cached together do not
+# expire together, and in the last EARLY_REFRESH_WINDOW of its TTL a get()
+# reports a miss with probability exp(-beta * remaining / window), so one
+# caller refreshes the entry before it hard-expires for everyone
+TTL_JITTER = 0.1
+EARLY_REFRESH_WINDOW = 0.1
+EARLY_REFRESH_BETA = 5.0
+
+# bytes payloads at least this large are stored raw so get_view can mmap them
+MMAP_THRESHOLD = 256 * 1024
+
 class CacheType(Enum):
     """Types of cached data"""
     WEB_CONTENT = "web_content"
@@ -27,6 +107,43 @@ class CacheType(Enum):
     URL_ANALYSIS = "url_analysis"
     SCRAPED_DATA = "scraped_data"
 
+# Cache types whose payloads are normally plain JSON (HTML text, result dicts)
+JSON_CACHE_TYPES = frozenset({
+    CacheType.WEB_CONTENT,
+    CacheType.SEARCH_RESULTS,
+    CacheType.GRANT_VALIDATION,
+    CacheType.URL_ANALYSIS,
+})
+
+# Cache types whose large bytes payloads are stored raw for get_view
+BLOB_CACHE_TYPES = frozenset({
+    CacheType.WEB_CONTENT,
+    CacheType.SCRAPED_DATA,
+})
+
+def _is_json_native(value: Any) -> bool:
+    """
+    True if value survives a JSON round trip unchanged
+    Tuples, bytes, sets, non-string keys and non-finite floats do not.
+    """
+    value_type = type(value)
+    if value_type is str or value_type is bool or value is None:
+        return True
+    if value_type is int:
+        return -2**63 <= value < 2**63
+    if value_type is float:
+        return math.isfinite(value)
+    if value_type is list:
+        return all(_is_json_native(item) for item in value)
+    if value_type is dict:
+        return all(type(k) is str and _is_json_native(v) for k, v in value.items())
+    return False
+
+@functools.lru_cache(maxsize=4096)
+def _make_full_key(key: str, cache_type: CacheType) -> str:
+    """Create full cache key with type prefix (hashed into the cache file name)"""
+    return f"{cache_type.value}:{key}"
+
 @dataclass
 class CacheEntry:
     """Represents a cache entry with metadata"""
@@ -38,24 +155,81 @@ class CacheEntry:
     access_count: int = 0
     last_accessed: Optional[datetime] = None
     metadata: Dict[str, Any] = None
+    # Epoch-second copies of created_at/expires_at for cheap expiry checks
+    created_at_ts: Optional[float] = None
+    expires_at_ts: Optional[float] = None
+    ttl_seconds: Optional[float] = None
     
-    def is_expired(self) -> bool:
+    def __post_init__(self):
+        if self.created_at_ts is None:
+            self.created_at_ts = self.created_at.timestamp()
+        if self.expires_at_ts is None and self.expires_at is not None:
+            self.expires_at_ts = self.expires_at.timestamp()
+    
+    def __setstate__(self, state):
+        # Entries pickled before the timestamp fields existed
+        self.__dict__.update(state)
+        if 'created_at_ts' not in state:
+            self.created_at_ts = self.expires_at_ts = None
+            self.__post_init__()
+    
+    def is_expired(self, now_ts: Optional[float] = None) -> bool:
         """Check if cache entry is expired"""
-        if self.expires_at is None:
+        if self.expires_at_ts is None:
+            return False
+        return (time.time() if now_ts is None else now_ts) > self.expires_at_ts
+    
+    def should_refresh_early(self, now_ts: float) -> bool:
+        """Randomly treat an entry near the end of its TTL as a miss (see EARLY_REFRESH_WINDOW)"""
+        if self.expires_at_ts is None or not self.ttl_seconds:
+            return False
+        
+        window = self.ttl_seconds * EARLY_REFRESH_WINDOW
+        remaining = self.expires_at_ts - now_ts
+        if remaining >= window:
             return False
-        return datetime.now() > self.expires_at
+        return random.random() < math.exp(-EARLY_REFRESH_BETA * remaining / window)
     
     def touch(self):
         """Update access information"""
         self.access_count += 1
         self.last_accessed = datetime.now()
 
+def _run_writer(write_queue: queue.Queue):
+    """
+    Background writer thread body
+    
+    The thread holds no reference to the manager; each queued task carries
+    one until it is done, so a manager with work outstanding stays alive and
+    an idle, unreferenced one can be collected. A task with no key is the
+    startup sweep of expired entries.
+    """
+    while True:
+        item = write_queue.get()
+        try:
+            if item is None:
+                return
+            manager, mem_key = item
+            if mem_key is None:
+                manager._cleanup_expired_entries()
+            else:
+                manager._write_pending(mem_key)
+        finally:
+            item = manager = None
+            write_queue.task_done()
+
+def _stop_writer(write_queue: queue.Queue, writer: threading.Thread):
+    """Finalizer: let the writer finish queued writes, then stop it"""
+    write_queue.put(None)
+    if writer is not threading.current_thread():
+        writer.join()
+
 class IntelligentCacheManager:
     """
     Intelligent caching system that provides:
     - Multi-level caching (memory + disk)
     - TTL-based expiration
-    - LRU eviction for memory cache
+    - LRU eviction for memory cache, admitting disk hits on their second use
     - Compression for large entries
     - Cache analytics and monitoring
     - Automatic cleanup
@@ -88,8 +262,19 @@ class IntelligentCacheManager:
         self.default_ttl_hours = default_ttl_hours
         self.enable_compression = enable_compression
         
-        # Memory cache: LRU implementation using dict (Python 3.7+ maintains insertion order)
-        self.memory_cache: Dict[str, CacheEntry] = {}
+        # Memory cache: LRU order kept by OrderedDict (most recently used last)
+        # keyed by (cache_type, key); tuples hash faster than a built "type:key" string
+        self.memory_cache: "OrderedDict[Tuple[CacheType, str], CacheEntry]" = OrderedDict()
+        
+        # Admission filter: keys seen once on disk (value: when). A disk hit is
+        # promoted into memory only if its key is already here, so one-shot
+        # URLs from a discovery sweep do not evict entries that are reused.
+        self._ghost: "OrderedDict[Tuple[CacheType, str], float]" = OrderedDict()
+        self._ghost_size = memory_cache_size * 4
+        
+        # Guards memory_cache and _ghost, which get() may now reach from
+        # several threads (get_or_load callers, AsyncCacheManager's pool)
+        self._memory_lock = threading.Lock()
         
         # Cache statistics
         self.stats = {
@@ -108,10 +293,47 @@ class IntelligentCacheManager:
             type_dir = self.cache_dir / cache_type.value
             type_dir.mkdir(exist_ok=True)
         
-        self.logger.info(f"Initialized IntelligentCacheManager at {self.cache_dir}")
+        # Background disk writer: set() records the newest entry per key in
+        # _pending and queues the key once, so rapid overwrites of the same
+        # key collapse into a single disk write. _disk_lock is held by the
+        # writer while saving and by delete/clear, so a removed entry cannot
+        # be written back afterwards.
+        self._pending: Dict[Tuple[CacheType, str], CacheEntry] = {}
+        self._pending_lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self._write_queue: "queue.Queue[Optional[Tuple[IntelligentCacheManager, Tuple[CacheType, str]]]]" = queue.Queue()
+        
+        # Compressor is only used by the writer thread; decompressors are
+        # not thread-safe, so each reading thread gets its own
+        self._zstd_compressor = zstandard.ZstdCompressor(level=1) if ZSTD_AVAILABLE else None
+        self._zstd_local = threading.local()
+        
+        # Shard directories known to exist (entries live in
+        # type/ab/abcd...__<expiry>.pkl) and cached listings of them
+        self._shard_dirs: set = set()
+        self._shard_index: Dict[Path, Tuple[int, Dict[str, str]]] = {}
+        self._closed = False
         
-        # Perform startup cleanup
-        self._cleanup_expired_entries()
+        # Loads in progress for get_or_load, so concurrent misses share one
+        self._inflight: Dict[Tuple[CacheType, str], Future] = {}
+        self._inflight_lock = threading.Lock()
+        
+        self.logger.info("Initialized IntelligentCacheManager at %s", self.cache_dir)
+        
+        # The startup cleanup is the writer's first task, so construction does
+        # not wait on a sweep of the whole cache directory but flush() does.
+        # The finalizer stops the writer when the manager is collected or at exit.
+        self._write_queue.put((self, None))
+        self._writer = threading.Thread(target=_run_writer, args=(self._write_queue,),
+                                        name="cache-writer", daemon=True)
+        self._writer.start()
+        self._finalizer = weakref.finalize(self, _stop_writer, self._write_queue, self._writer)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def get(self, key: str, cache_type: CacheType = CacheType.WEB_CONTENT) -> Optional[Any]:
         """
@@ -125,41 +347,62 @@ class IntelligentCacheManager:
             Cached data if found and not expired, None otherwise
         """
         # Check memory cache first
-        full_key = self._make_full_key(key, cache_type)
+        mem_key = (cache_type, key)
+        now_ts = time.time()
+        
+        with self._memory_lock:
+            entry = self.memory_cache.get(mem_key)
+            if entry is not None:
+                if entry.is_expired(now_ts):
+                    # Remove expired entry
+                    del self.memory_cache[mem_key]
+                else:
+                    # Move to end (LRU)
+                    self.memory_cache.move_to_end(mem_key)
         
-        if full_key in self.memory_cache:
-            entry = self.memory_cache[full_key]
+        if entry is not None:
+            if entry.is_expired(now_ts):
+                self._remove_from_disk(_make_full_key(key, cache_type), cache_type)
+                self.stats['misses'] += 1
+                return None
             
-            if entry.is_expired():
-                # Remove expired entry
-                del self.memory_cache[full_key]
-                self._remove_from_disk(full_key, cache_type)
+            if entry.should_refresh_early(now_ts):
+                # Leave the entry for other callers; this one refreshes it
                 self.stats['misses'] += 1
                 return None
             
-            # Move to end (LRU)
-            self.memory_cache[full_key] = self.memory_cache.pop(full_key)
             entry.touch()
             self.stats['memory_hits'] += 1
             
-            self.logger.debug(f"Memory cache hit for {key}")
+            self.logger.debug("Memory cache hit for %s", key)
             return entry.data
         
-        # Check disk cache
-        disk_entry = self._load_from_disk(full_key, cache_type)
+        # Check disk cache (entries still waiting for the writer come first)
+        full_key = _make_full_key(key, cache_type)
+        disk_entry = self._pending.get(mem_key) or self._load_from_disk(full_key, cache_type)
         if disk_entry:
-            if disk_entry.is_expired():
+            if disk_entry.is_expired(now_ts):
                 # Remove expired entry
                 self._remove_from_disk(full_key, cache_type)
                 self.stats['misses'] += 1
                 return None
             
-            # Load into memory cache
-            self._add_to_memory(full_key, disk_entry)
+            if disk_entry.should_refresh_early(now_ts):
+                self.stats['misses'] += 1
+                return None
+            
+            # Load into memory cache on the second hit
+            with self._memory_lock:
+                if self._ghost.pop(mem_key, None) is not None:
+                    self._add_to_memory(mem_key, disk_entry)
+                else:
+                    self._ghost[mem_key] = now_ts
+                    if len(self._ghost) > self._ghost_size:
+                        self._ghost.popitem(last=False)
             disk_entry.touch()
             self.stats['disk_hits'] += 1
             
-            self.logger.debug(f"Disk cache hit for {key}")
+            self.logger.debug("Disk cache hit for %s", key)
             return disk_entry.data
         
         self.stats['misses'] += 1
@@ -180,38 +423,124 @@ class IntelligentCacheManager:
         if ttl_hours is None:
             ttl_hours = self.default_ttl_hours
         
-        expires_at = datetime.now() + timedelta(hours=ttl_hours) if ttl_hours > 0 else None
-        full_key = self._make_full_key(key, cache_type)
+        now_ts = time.time()
+        ttl_seconds = ttl_hours * 3600 * random.uniform(1 - TTL_JITTER, 1 + TTL_JITTER) if ttl_hours > 0 else None
+        expires_at_ts = now_ts + ttl_seconds if ttl_seconds else None
+        mem_key = (cache_type, key)
         
         entry = CacheEntry(
             key=key,
             data=data,
             cache_type=cache_type,
-            created_at=datetime.now(),
-            expires_at=expires_at,
-            metadata=metadata or {}
+            created_at=datetime.fromtimestamp(now_ts),
+            expires_at=datetime.fromtimestamp(expires_at_ts) if expires_at_ts else None,
+            metadata=metadata or {},
+            created_at_ts=now_ts,
+            expires_at_ts=expires_at_ts,
+            ttl_seconds=ttl_seconds
         )
         
         # Add to memory cache
-        self._add_to_memory(full_key, entry)
+        with self._memory_lock:
+            self._add_to_memory(mem_key, entry)
+        
+        # Hand the disk write to the background writer
+        if self._closed:
+            self._save_to_disk(_make_full_key(key, cache_type), entry)
+        else:
+            with self._pending_lock:
+                is_queued = mem_key in self._pending
+                self._pending[mem_key] = entry
+            if not is_queued:
+                self._write_queue.put((self, mem_key))
+        
+        self.logger.debug("Cached %s with TTL %sh", key, ttl_hours)
+    
+    def get_view(self, key: str, cache_type: CacheType = CacheType.SCRAPED_DATA) -> Optional[memoryview]:
+        """
+        Get cached bytes as a read-only memoryview without copying large blobs
+        
+        Large bytes entries on disk are memory-mapped instead of read, and are
+        not pulled into the memory cache. Other entries are served through
+        get(). Returns None on a miss or when the cached data is not bytes.
+        """
+        mem_key = (cache_type, key)
+        if mem_key not in self.memory_cache and mem_key not in self._pending:
+            view = self._map_from_disk(_make_full_key(key, cache_type), cache_type)
+            if view is not None:
+                self.stats['disk_hits'] += 1
+                self.logger.debug("Mapped disk cache hit for %s", key)
+                return view
+        
+        data = self.get(key, cache_type)
+        return memoryview(data) if isinstance(data, bytes) else None
+    
+    def get_or_load(self, key: str, loader: Callable[[], Any],
+                    cache_type: CacheType = CacheType.WEB_CONTENT,
+                    ttl_hours: Optional[int] = None, metadata: Optional[Dict] = None) -> Any:
+        """
+        Get cached data, calling loader once on a miss even if many threads miss together
+        
+        The first thread to miss runs loader() and caches its result; threads
+        missing the same key meanwhile wait for that result (or exception)
+        instead of loading it again. A None result is returned but not cached.
+        
+        Args:
+            key: Cache key
+            loader: Zero-argument callable producing the data on a miss
+            cache_type: Type of cached data
+            ttl_hours: Time to live in hours (None for default)
+            metadata: Additional metadata
+            
+        Returns:
+            Cached or freshly loaded data
+        """
+        data = self.get(key, cache_type)
+        if data is not None:
+            return data
         
-        # Save to disk asynchronously (in practice, would use thread pool)
-        self._save_to_disk(full_key, entry)
+        mem_key = (cache_type, key)
+        with self._inflight_lock:
+            future = self._inflight.get(mem_key)
+            is_leader = future is None
+            if is_leader:
+                future = self._inflight[mem_key] = Future()
         
-        self.logger.debug(f"Cached {key} with TTL {ttl_hours}h")
+        if not is_leader:
+            return future.result()
+        
+        try:
+            # A previous leader may have stored the value between our miss
+            # and taking the lead; only load if it is still missing
+            data = self.get(key, cache_type)
+            if data is None:
+                data = loader()
+                if data is not None:
+                    self.set(key, data, cache_type, ttl_hours, metadata)
+            future.set_result(data)
+            return data
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[mem_key]
     
     def delete(self, key: str, cache_type: CacheType = CacheType.WEB_CONTENT):
         """Delete cached entry"""
-        full_key = self._make_full_key(key, cache_type)
+        mem_key = (cache_type, key)
         
         # Remove from memory
-        if full_key in self.memory_cache:
-            del self.memory_cache[full_key]
+        with self._memory_lock:
+            self.memory_cache.pop(mem_key, None)
         
-        # Remove from disk
-        self._remove_from_disk(full_key, cache_type)
+        # Remove from disk, dropping any write still pending
+        with self._disk_lock:
+            with self._pending_lock:
+                self._pending.pop(mem_key, None)
+            self._remove_from_disk(_make_full_key(key, cache_type), cache_type)
         
-        self.logger.debug(f"Deleted cache entry {key}")
+        self.logger.debug("Deleted cache entry %s", key)
     
     def clear(self, cache_type: Optional[CacheType] = None):
         """
@@ -222,24 +551,38 @@ class IntelligentCacheManager:
         """
         if cache_type is None:
             # Clear everything
-            self.memory_cache.clear()
-            for cache_type_enum in CacheType:
-                type_dir = self.cache_dir / cache_type_enum.value
-                for file_path in type_dir.glob("*.pkl"):
-                    file_path.unlink()
+            with self._memory_lock:
+                self.memory_cache.clear()
+            with self._disk_lock:
+                with self._pending_lock:
+                    self._pending.clear()
+                for cache_type_enum in CacheType:
+                    self._unlink_cache_files(cache_type_enum)
             self.logger.info("Cleared all cache")
         else:
             # Clear specific type
-            to_remove = [k for k, v in self.memory_cache.items() 
-                        if v.cache_type == cache_type]
-            for key in to_remove:
-                del self.memory_cache[key]
+            with self._memory_lock:
+                to_remove = [k for k, v in self.memory_cache.items() 
+                            if v.cache_type == cache_type]
+                for key in to_remove:
+                    del self.memory_cache[key]
             
-            type_dir = self.cache_dir / cache_type.value
-            for file_path in type_dir.glob("*.pkl"):
-                file_path.unlink()
+            with self._disk_lock:
+                with self._pending_lock:
+                    for key in [k for k, v in self._pending.items() if v.cache_type == cache_type]:
+                        del self._pending[key]
+                self._unlink_cache_files(cache_type)
             
-            self.logger.info(f"Cleared {cache_type.value} cache")
+            self.logger.info("Cleared %s cache", cache_type.value)
+    
+    def _unlink_cache_files(self, cache_type: CacheType):
+        """Remove every cache file of a type (caller holds _disk_lock)"""
+        for file_entry in self._iter_cache_files(cache_type):
+            try:
+                os.unlink(file_entry.path)
+            except FileNotFoundError:
+                # Already removed by the startup sweep or a concurrent get
+                pass
     
     def cleanup(self, max_age_hours: Optional[int] = None):
         """
@@ -252,8 +595,24 @@ class IntelligentCacheManager:
         self._cleanup_disk_cache(max_age_hours)
         self.logger.info("Cache cleanup completed")
     
+    def flush(self):
+        """Block until the startup sweep and every queued disk write have completed"""
+        if not self._closed:
+            self._write_queue.join()
+    
+    def close(self):
+        """Flush pending writes and stop the background writer"""
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        self._finalizer()
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
+        # Disk counters below should reflect every set() made so far
+        self.flush()
+        
         total_requests = sum([
             self.stats['memory_hits'],
             self.stats['disk_hits'],
@@ -264,8 +623,9 @@ class IntelligentCacheManager:
         if total_requests > 0:
             hit_rate = (self.stats['memory_hits'] + self.stats['disk_hits']) / total_requests
         
-        # Disk usage
-        disk_usage = self._calculate_disk_usage()
+        # Disk usage and per-type counts from one directory walk
+        disk_scan = self._scan_cache_dirs()
+        disk_usage = sum(size for _, size in disk_scan.values())
         
         return {
             **self.stats,
@@ -273,173 +633,416 @@ class IntelligentCacheManager:
             'hit_rate': hit_rate,
             'memory_cache_size': len(self.memory_cache),
             'disk_usage_mb': disk_usage / (1024 * 1024),
-            'cache_types': self._count_by_type()
+            'cache_types': {type_value: count for type_value, (count, _) in disk_scan.items()}
         }
     
-    def _make_full_key(self, key: str, cache_type: CacheType) -> str:
-        """Create full cache key with type prefix"""
-        return f"{cache_type.value}:{key}"
-    
     def _make_cache_key(self, data: Union[str, Dict, List]) -> str:
         """Generate cache key from data"""
         if isinstance(data, str):
-            content = data
-        else:
-            content = json.dumps(data, sort_keys=True)
+            return _hash_key(data)
         
-        return hashlib.md5(content.encode('utf-8')).hexdigest()
+        # Serialized dicts/lists are rarely repeated; don't memoize them
+        content = json.dumps(data, sort_keys=True)
+        return _hash_key.__wrapped__(content)
     
-    def _add_to_memory(self, full_key: str, entry: CacheEntry):
-        """Add entry to memory cache with LRU eviction"""
-        # Remove if already exists (for updating position)
-        if full_key in self.memory_cache:
-            del self.memory_cache[full_key]
+    def _add_to_memory(self, mem_key: Tuple[CacheType, str], entry: CacheEntry):
+        """Add entry to memory cache with LRU eviction (caller holds _memory_lock)"""
+        # Add or replace, then mark as most recently used
+        self.memory_cache[mem_key] = entry
+        self.memory_cache.move_to_end(mem_key)
         
-        # Add to end
-        self.memory_cache[full_key] = entry
-        
-        # Evict oldest if over limit
-        while len(self.memory_cache) > self.memory_cache_size:
-            oldest_key = next(iter(self.memory_cache))
-            del self.memory_cache[oldest_key]
+        # Evict oldest if over limit (one insert needs at most one eviction)
+        if len(self.memory_cache) > self.memory_cache_size:
+            self.memory_cache.popitem(last=False)
             self.stats['evictions'] += 1
     
+    def _write_pending(self, mem_key: Tuple[CacheType, str]):
+        """Writer thread: save the latest pending entry for a queued key"""
+        with self._disk_lock:
+            with self._pending_lock:
+                entry = self._pending.pop(mem_key, None)
+            if entry is not None:
+                self._save_to_disk(_make_full_key(entry.key, entry.cache_type), entry)
+    
+    def _shard_location(self, full_key: str, cache_type: CacheType) -> Tuple[Path, str]:
+        """Shard directory and file key for a cache key (shards are the first two hex digits)"""
+        file_key = _hash_key(full_key)
+        return self.cache_dir / cache_type.value / file_key[:2], file_key
+    
+    def _shard_listing(self, shard_dir: Path) -> Dict[str, str]:
+        """
+        Map of file key -> file name for one shard
+        
+        Listings are cached and rescanned only when the directory's mtime
+        changes, so files written by other processes are still found.
+        """
+        try:
+            mtime_ns = os.stat(shard_dir).st_mtime_ns
+        except FileNotFoundError:
+            return {}
+        
+        cached = self._shard_index.get(shard_dir)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        
+        listing = {}
+        with os.scandir(shard_dir) as entries:
+            for entry in entries:
+                if _parse_file_expiry(entry.name) is not None:
+                    listing[entry.name.partition('__')[0]] = entry.name
+        self._shard_index[shard_dir] = (mtime_ns, listing)
+        return listing
+    
+    def _find_disk_file(self, shard_dir: Path, file_key: str) -> Optional[Path]:
+        """Current cache file for a key, whatever expiry its name carries"""
+        file_name = self._shard_listing(shard_dir).get(file_key)
+        return shard_dir / file_name if file_name else None
+    
+    def _legacy_paths(self, full_key: str, cache_type: CacheType) -> List[Path]:
+        """Paths older versions stored a key under, without the expiry in the name"""
+        shard_dir, file_key = self._shard_location(full_key, cache_type)
+        type_dir = shard_dir.parent
+        paths = [shard_dir / f"{file_key}.pkl", type_dir / f"{file_key}.pkl"]
+        if XXHASH_AVAILABLE:
+            paths.append(type_dir / f"{hashlib.md5(full_key.encode()).hexdigest()}.pkl")
+        return paths
+    
+    def _load_legacy_file(self, full_key: str, cache_type: CacheType) -> Optional[CacheEntry]:
+        """Load an old-layout cache file and move it to its current name"""
+        for legacy_path in self._legacy_paths(full_key, cache_type):
+            if legacy_path.exists():
+                break
+        else:
+            return None
+        
+        entry = self._deserialize_entry(legacy_path.read_bytes())
+        self.stats['disk_reads'] += 1
+        
+        shard_dir, file_key = self._shard_location(full_key, cache_type)
+        with self._disk_lock:
+            if self._find_disk_file(shard_dir, file_key) is None:
+                self._ensure_shard_dir(shard_dir)
+                os.replace(legacy_path, shard_dir / _expiring_file_name(file_key, entry.expires_at_ts))
+                self._shard_index.pop(shard_dir, None)
+        return entry
+    
+    def _ensure_shard_dir(self, shard_dir: Path):
+        """Create a shard directory the first time this manager writes into it"""
+        if shard_dir not in self._shard_dirs:
+            shard_dir.mkdir(exist_ok=True)
+            self._shard_dirs.add(shard_dir)
+    
+    def _iter_cache_files(self, cache_type: CacheType):
+        """Yield os.DirEntry objects for every cache file of a type (shards and old flat layout)"""
+        type_dir = self.cache_dir / cache_type.value
+        try:
+            with os.scandir(type_dir) as top_entries:
+                for top_entry in top_entries:
+                    if top_entry.is_dir(follow_symlinks=False):
+                        with os.scandir(top_entry.path) as shard_entries:
+                            for entry in shard_entries:
+                                if entry.name.endswith('.pkl'):
+                                    yield entry
+                    elif top_entry.name.endswith('.pkl'):
+                        yield top_entry
+        except FileNotFoundError:
+            return
+    
     def _save_to_disk(self, full_key: str, entry: CacheEntry):
         """Save entry to disk"""
         try:
-            cache_type_dir = self.cache_dir / entry.cache_type.value
-            file_key = hashlib.md5(full_key.encode()).hexdigest()
-            file_path = cache_type_dir / f"{file_key}.pkl"
+            shard_dir, file_key = self._shard_location(full_key, entry.cache_type)
+            self._ensure_shard_dir(shard_dir)
+            file_path = shard_dir / _expiring_file_name(file_key, entry.expires_at_ts)
+            old_path = self._find_disk_file(shard_dir, file_key)
             
-            # Prepare data for serialization
-            serializable_entry = {
-                'key': entry.key,
-                'data': entry.data,
-                'cache_type': entry.cache_type.value,
-                'created_at': entry.created_at.isoformat(),
-                'expires_at': entry.expires_at.isoformat() if entry.expires_at else None,
-                'access_count': entry.access_count,
-                'last_accessed': entry.last_accessed.isoformat() if entry.last_accessed else None,
-                'metadata': entry.metadata
-            }
+            # Write a temp file and rename it into place, so readers never see
+            # a partial entry. No fsync: a cache entry lost in a crash is
+            # just a miss.
+            payload = self._serialize_entry(entry)
+            tmp_path = file_path.with_name(f"{file_path.name}.tmp.{os.urandom(4).hex()}")
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_path, file_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
             
-            with open(file_path, 'wb') as f:
-                pickle.dump(serializable_entry, f)
+            # A new expiry means a new name; drop the file it replaces
+            if old_path is not None and old_path != file_path:
+                old_path.unlink(missing_ok=True)
+            self._shard_index.pop(shard_dir, None)
             
             self.stats['disk_writes'] += 1
             
         except Exception as e:
-            self.logger.warning(f"Failed to save cache entry to disk: {e}")
+            self.logger.warning("Failed to save cache entry to disk: %s", e)
     
     def _load_from_disk(self, full_key: str, cache_type: CacheType) -> Optional[CacheEntry]:
         """Load entry from disk"""
         try:
-            cache_type_dir = self.cache_dir / cache_type.value
-            file_key = hashlib.md5(full_key.encode()).hexdigest()
-            file_path = cache_type_dir / f"{file_key}.pkl"
+            shard_dir, file_key = self._shard_location(full_key, cache_type)
+            file_path = self._find_disk_file(shard_dir, file_key)
             
-            if not file_path.exists():
+            if file_path is None:
+                return self._load_legacy_file(full_key, cache_type)
+            
+            entry = self._deserialize_entry(file_path.read_bytes())
+            
+            self.stats['disk_reads'] += 1
+            return entry
+        
+        except FileNotFoundError:
+            # Removed by another manager since the shard was listed
+            return None
+        except Exception as e:
+            self.logger.warning("Failed to load cache entry from disk: %s", e)
+            return None
+    
+    def _serialize_entry(self, entry: CacheEntry) -> bytes:
+        """
+        Encode an entry as a tagged orjson record when its payload is JSON-native,
+        else pickle the CacheEntry itself
+        """
+        if (type(entry.data) is bytes and entry.cache_type in BLOB_CACHE_TYPES
+                and len(entry.data) >= MMAP_THRESHOLD):
+            # Left uncompressed so get_view can map the payload in place
+            header = pickle.dumps(replace(entry, data=None), protocol=pickle.HIGHEST_PROTOCOL)
+            return b''.join((_FORMAT_RAW, _RAW_HEADER.pack(len(header)), header, entry.data))
+        
+        if (ORJSON_AVAILABLE and entry.cache_type in JSON_CACHE_TYPES
+                and _is_json_native(entry.data) and _is_json_native(entry.metadata)):
+            record = {
+                'key': entry.key,
+                'data': entry.data,
+                'cache_type': entry.cache_type.value,
+                'created_at': entry.created_at.isoformat(),
+                'expires_at': entry.expires_at.isoformat() if entry.expires_at else None,
+                'access_count': entry.access_count,
+                'last_accessed': entry.last_accessed.isoformat() if entry.last_accessed else None,
+                'metadata': entry.metadata,
+                'ttl_seconds': entry.ttl_seconds
+            }
+            try:
+                return self._compress(_FORMAT_JSON + orjson.dumps(record))
+            except (orjson.JSONEncodeError, RecursionError):
+                pass  # e.g. lone surrogates; pickle handles any str
+        
+        return self._compress(_FORMAT_PICKLE + pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL))
+    
+    def _compress(self, payload: bytes) -> bytes:
+        """Wrap a tagged record in zstd (or zlib) when compression is enabled and it is large"""
+        if not self.enable_compression or len(payload) <= COMPRESSION_THRESHOLD:
+            return payload
+        
+        self.stats['compressions'] += 1
+        if self._zstd_compressor is not None:
+            return _FORMAT_ZSTD + self._zstd_compressor.compress(payload)
+        return _FORMAT_ZLIB + zlib.compress(payload, 1)
+    
+    def _deserialize_entry(self, raw: bytes) -> CacheEntry:
+        """Decode an entry written by _serialize_entry or an untagged legacy pickle"""
+        tag = raw[:1]
+        if tag == _FORMAT_ZSTD:
+            decompressor = getattr(self._zstd_local, 'decompressor', None)
+            if decompressor is None:
+                decompressor = self._zstd_local.decompressor = zstandard.ZstdDecompressor()
+            self.stats['decompressions'] += 1
+            return self._deserialize_entry(decompressor.decompress(memoryview(raw)[1:]))
+        if tag == _FORMAT_ZLIB:
+            self.stats['decompressions'] += 1
+            return self._deserialize_entry(zlib.decompress(memoryview(raw)[1:]))
+        if tag == _FORMAT_RAW:
+            entry, payload_offset = self._read_raw_header(raw)
+            entry.data = bytes(memoryview(raw)[payload_offset:])
+            return entry
+        if tag == _FORMAT_JSON:
+            body = memoryview(raw)[1:]
+            return self._entry_from_record(orjson.loads(body) if ORJSON_AVAILABLE else json.loads(bytes(body)))
+        
+        # Pickled CacheEntry, or a record dict from older cache files
+        data = pickle.loads(memoryview(raw)[1:] if tag == _FORMAT_PICKLE else raw)
+        if isinstance(data, dict):
+            return self._entry_from_record(data)
+        return data
+    
+    def _read_raw_header(self, raw) -> Tuple[CacheEntry, int]:
+        """Data-less entry from a raw blob file and the offset its payload starts at"""
+        (header_len,) = _RAW_HEADER.unpack_from(raw, 1)
+        header_start = 1 + _RAW_HEADER.size
+        entry = pickle.loads(memoryview(raw)[header_start:header_start + header_len])
+        return entry, header_start + header_len
+    
+    def _map_from_disk(self, full_key: str, cache_type: CacheType) -> Optional[memoryview]:
+        """Memory-map the payload of a live raw blob file, or None if the entry is not one"""
+        try:
+            file_path = self._find_disk_file(*self._shard_location(full_key, cache_type))
+            if file_path is None:
                 return None
             
             with open(file_path, 'rb') as f:
-                data = pickle.load(f)
+                if f.read(1) != _FORMAT_RAW:
+                    return None
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
             
-            # Reconstruct CacheEntry
-            entry = CacheEntry(
-                key=data['key'],
-                data=data['data'],
-                cache_type=CacheType(data['cache_type']),
-                created_at=datetime.fromisoformat(data['created_at']),
-                expires_at=datetime.fromisoformat(data['expires_at']) if data['expires_at'] else None,
-                access_count=data['access_count'],
-                last_accessed=datetime.fromisoformat(data['last_accessed']) if data['last_accessed'] else None,
-                metadata=data['metadata']
-            )
+            entry, payload_offset = self._read_raw_header(mapped)
+            if entry.is_expired():
+                mapped.close()
+                return None
             
+            # The view keeps the mapping open until it is released
             self.stats['disk_reads'] += 1
-            return entry
-            
+            return memoryview(mapped)[payload_offset:]
+        
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            self.logger.warning(f"Failed to load cache entry from disk: {e}")
+            self.logger.warning("Failed to map cache entry from disk: %s", e)
             return None
     
+    def _entry_from_record(self, data: Dict[str, Any]) -> CacheEntry:
+        """Rebuild a CacheEntry from its JSON/dict record"""
+        return CacheEntry(
+            key=data['key'],
+            data=data['data'],
+            cache_type=CacheType(data['cache_type']),
+            created_at=datetime.fromisoformat(data['created_at']),
+            expires_at=datetime.fromisoformat(data['expires_at']) if data['expires_at'] else None,
+            access_count=data['access_count'],
+            last_accessed=datetime.fromisoformat(data['last_accessed']) if data['last_accessed'] else None,
+            metadata=data['metadata'],
+            ttl_seconds=data.get('ttl_seconds')
+        )
+    
     def _remove_from_disk(self, full_key: str, cache_type: CacheType):
         """Remove entry from disk"""
         try:
-            cache_type_dir = self.cache_dir / cache_type.value
-            file_key = hashlib.md5(full_key.encode()).hexdigest()
-            file_path = cache_type_dir / f"{file_key}.pkl"
+            shard_dir, file_key = self._shard_location(full_key, cache_type)
+            file_path = self._find_disk_file(shard_dir, file_key)
+            
+            if file_path is not None:
+                file_path.unlink(missing_ok=True)
+                self._shard_index.pop(shard_dir, None)
             
-            if file_path.exists():
-                file_path.unlink()
+            for legacy_path in self._legacy_paths(full_key, cache_type):
+                if legacy_path.exists():
+                    legacy_path.unlink()
                 
         except Exception as e:
-            self.logger.warning(f"Failed to remove cache entry from disk: {e}")
+            self.logger.warning("Failed to remove cache entry from disk: %s", e)
     
     def _cleanup_memory_cache(self, max_age_hours: Optional[int] = None):
         """Clean up memory cache"""
-        now = datetime.now()
-        to_remove = []
+        now_ts = time.time()
+        oldest_ts = now_ts - max_age_hours * 3600 if max_age_hours else None
         
-        for key, entry in self.memory_cache.items():
-            if entry.is_expired():
-                to_remove.append(key)
-            elif max_age_hours and entry.created_at < now - timedelta(hours=max_age_hours):
-                to_remove.append(key)
-        
-        for key in to_remove:
-            del self.memory_cache[key]
+        with self._memory_lock:
+            to_remove = []
+            
+            for key, entry in self.memory_cache.items():
+                if entry.is_expired(now_ts):
+                    to_remove.append(key)
+                elif oldest_ts is not None and entry.created_at_ts < oldest_ts:
+                    to_remove.append(key)
+            
+            for key in to_remove:
+                del self.memory_cache[key]
     
     def _cleanup_disk_cache(self, max_age_hours: Optional[int] = None):
         """Clean up disk cache"""
+        now_ts = time.time()
+        oldest_ts = now_ts - max_age_hours * 3600 if max_age_hours else None
+        
         for cache_type in CacheType:
-            type_dir = self.cache_dir / cache_type.value
-            
-            for file_path in type_dir.glob("*.pkl"):
+            for file_entry in self._iter_cache_files(cache_type):
                 try:
-                    # Check file age
-                    file_age = datetime.now() - datetime.fromtimestamp(file_path.stat().st_mtime)
-                    
                     should_remove = False
                     
-                    if max_age_hours and file_age > timedelta(hours=max_age_hours):
+                    # Check file age
+                    if oldest_ts is not None and file_entry.stat().st_mtime < oldest_ts:
                         should_remove = True
                     else:
-                        # Load and check expiration
-                        entry = self._load_from_disk(file_path.stem, cache_type)
-                        if entry and entry.is_expired():
-                            should_remove = True
+                        # Expiry is read from the file name; only old-layout
+                        # files have to be decoded
+                        expires_ts = _parse_file_expiry(file_entry.name)
+                        if expires_ts is None:
+                            with open(file_entry.path, 'rb') as f:
+                                should_remove = self._deserialize_entry(f.read()).is_expired(now_ts)
+                        else:
+                            should_remove = 0 < expires_ts < now_ts
                     
                     if should_remove:
-                        file_path.unlink()
-                        
+                        os.unlink(file_entry.path)
+                
+                except FileNotFoundError:
+                    # Removed or renamed by a concurrent get/delete
+                    continue
                 except Exception as e:
-                    self.logger.warning(f"Error during disk cleanup for {file_path}: {e}")
+                    self.logger.warning("Error during disk cleanup for %s: %s", file_entry.path, e)
     
     def _cleanup_expired_entries(self):
         """Startup cleanup of expired entries"""
         self.logger.info("Performing startup cache cleanup...")
         self._cleanup_disk_cache()
     
-    def _calculate_disk_usage(self) -> int:
-        """Calculate total disk usage in bytes"""
-        total_size = 0
+    def _scan_cache_dirs(self) -> Dict[str, Tuple[int, int]]:
+        """File count and total bytes per cache type, from a single scandir walk"""
+        results = {}
         for cache_type in CacheType:
-            type_dir = self.cache_dir / cache_type.value
-            for file_path in type_dir.glob("*.pkl"):
+            count = 0
+            total_size = 0
+            for file_entry in self._iter_cache_files(cache_type):
+                count += 1
                 try:
-                    total_size += file_path.stat().st_size
-                except:
+                    total_size += file_entry.stat().st_size
+                except OSError:
                     pass
-        return total_size
+            results[cache_type.value] = (count, total_size)
+        return results
+    
+    def _calculate_disk_usage(self) -> int:
+        """Calculate total disk usage in bytes"""
+        return sum(size for _, size in self._scan_cache_dirs().values())
     
     def _count_by_type(self) -> Dict[str, int]:
         """Count entries by cache type"""
-        counts = {}
-        for cache_type in CacheType:
-            type_dir = self.cache_dir / cache_type.value
-            counts[cache_type.value] = len(list(type_dir.glob("*.pkl")))
-        return counts
+        return {type_value: count for type_value, (count, _) in self._scan_cache_dirs().items()}
+
+
+class AsyncCacheManager:
+    """
+    asyncio facade over IntelligentCacheManager
+    
+    get/delete can read or unlink cache files, so they run on a small
+    thread pool instead of blocking the event loop. set only updates the
+    memory tier and queues the disk write, so aset calls it directly.
+    """
+    
+    def __init__(self, cache_manager: Optional[IntelligentCacheManager] = None, max_workers: int = 4):
+        self.cache = cache_manager or IntelligentCacheManager()
+        self._io_pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='cache-io')
+    
+    async def aget(self, key: str, cache_type: CacheType = CacheType.WEB_CONTENT) -> Optional[Any]:
+        """Async get(); disk reads happen on the cache I/O pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_pool, self.cache.get, key, cache_type)
+    
+    async def aset(self, key: str, data: Any, cache_type: CacheType = CacheType.WEB_CONTENT,
+                   ttl_hours: Optional[int] = None, metadata: Optional[Dict] = None):
+        """Async set(); returns once the entry is in memory and its disk write is queued"""
+        self.cache.set(key, data, cache_type, ttl_hours, metadata)
+    
+    async def adelete(self, key: str, cache_type: CacheType = CacheType.WEB_CONTENT):
+        """Async delete(); file removal happens on the cache I/O pool"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._io_pool, self.cache.delete, key, cache_type)
+    
+    async def aclose(self):
+        """Flush pending writes, close the cache manager and stop the I/O pool"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._io_pool, self.cache.close)
+        self._io_pool.shutdown(wait=False)
 
 
 # Specialized cache helpers for common grant discovery use cases
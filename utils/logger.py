@@ -6,16 +6,27 @@ Provides structured logging across all modules with rotation and formatting
 
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import atexit
+import tempfile
+import threading
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from datetime import datetime
 from typing import Optional
 import sys
 
+# Where system.log goes unless GRANT_LOG_DIR says otherwise
+DEFAULT_LOG_DIR = os.path.join(tempfile.gettempdir(), "grant_reports")
+
 class GrantAgentLogger:
     """Centralized logger for Endemic Grant Agent"""
     
     _instance = None
     _logger = None
+    _configured = False
+    _configure_lock = threading.Lock()
+    _handlers = ()
+    _queue_handler = None
     
     def __new__(cls):
         if cls._instance is None:
@@ -25,19 +36,25 @@ class GrantAgentLogger:
     def __init__(self):
         if self._logger is not None:
             return
-            
-        # Create logs directory
-        log_dir = "/Users/home/grant_reports"
-        os.makedirs(log_dir, exist_ok=True)
         
-        # Configure logger
+        # Configure logger; handlers are attached on first use (see
+        # _configure) so importing this module touches no files
         self._logger = logging.getLogger("endemic_grant_agent")
         self._logger.setLevel(logging.INFO)
-        
-        # Prevent duplicate handlers
-        if self._logger.handlers:
-            return
-        
+    
+    def _configure(self):
+        """Attach the file and console handlers (runs once, on first use)"""
+        with self._configure_lock:
+            if self._configured:
+                return
+            
+            # Prevent duplicate handlers
+            if not self._logger.handlers:
+                self._add_handlers()
+            self._configured = True
+    
+    def _add_handlers(self):
+        """Attach the file and console handlers behind a queue listener"""
         # Create formatters
         file_formatter = logging.Formatter(
             '%(asctime)s | %(levelname)-8s | %(name)s | %(funcName)s:%(lineno)d | %(message)s',
@@ -48,30 +65,76 @@ class GrantAgentLogger:
             '%(levelname)-8s | %(message)s'
         )
         
-        # File handler with rotation (10MB max, keep 5 files)
-        file_handler = RotatingFileHandler(
-            os.path.join(log_dir, "system.log"),
-            maxBytes=10*1024*1024,  # 10MB
-            backupCount=5,
-            encoding='utf-8'
-        )
-        file_handler.setLevel(logging.INFO)
-        file_handler.setFormatter(file_formatter)
+        handlers = []
+        file_handler = self._create_file_handler(file_formatter)
+        if file_handler is not None:
+            handlers.append(file_handler)
         
-        # Console handler for immediate feedback
+        # Console handler for immediate feedback (LOG_LEVEL=INFO for progress messages)
+        console_level = logging.getLevelName(os.getenv('LOG_LEVEL', 'WARNING').upper())
+        if not isinstance(console_level, int):
+            console_level = logging.WARNING
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
+        console_handler.setLevel(console_level)
         console_handler.setFormatter(console_formatter)
+        handlers.append(console_handler)
         
-        # Add handlers
-        self._logger.addHandler(file_handler)
-        self._logger.addHandler(console_handler)
+        # Handlers run on a listener thread; logging calls only enqueue the
+        # record, so callers never wait on file or console I/O
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        self._handlers = tuple(handlers)
+        self._queue_handler = QueueHandler(log_queue)
+        self._logger.addHandler(self._queue_handler)
         
         # Log initial startup
         self._logger.info("=== Endemic Grant Agent Logger Initialized ===")
     
+    def _after_fork_in_child(self):
+        """
+        Forked workers (e.g. ProcessPoolExecutor) do not inherit the listener
+        thread, so nothing would drain the queue; attach the handlers directly
+        """
+        self._configure_lock = threading.Lock()
+        if self._queue_handler is None:
+            return
+        self._logger.removeHandler(self._queue_handler)
+        self._queue_handler = None
+        for handler in self._handlers:
+            self._logger.addHandler(handler)
+    
+    def _create_file_handler(self, formatter: logging.Formatter) -> Optional[RotatingFileHandler]:
+        """
+        Rotating system.log handler in GRANT_LOG_DIR, falling back to
+        DEFAULT_LOG_DIR in the temp directory when it is unset or cannot be created
+        """
+        log_dirs = dict.fromkeys((os.getenv('GRANT_LOG_DIR', DEFAULT_LOG_DIR), DEFAULT_LOG_DIR))
+        for log_dir in log_dirs:
+            try:
+                os.makedirs(log_dir, exist_ok=True)
+                # File handler with rotation (10MB max, keep 5 files)
+                file_handler = RotatingFileHandler(
+                    os.path.join(log_dir, "system.log"),
+                    maxBytes=10*1024*1024,  # 10MB
+                    backupCount=5,
+                    encoding='utf-8'
+                )
+            except OSError:
+                continue
+            
+            file_handler.setLevel(logging.INFO)
+            file_handler.setFormatter(formatter)
+            return file_handler
+        
+        # Console only
+        return None
+    
     def get_logger(self, name: Optional[str] = None) -> logging.Logger:
         """Get logger instance with optional module name"""
+        if not self._configured:
+            self._configure()
         if name:
             return logging.getLogger(f"endemic_grant_agent.{name}")
         return self._logger
@@ -100,6 +163,9 @@ class GrantAgentLogger:
 # Global logger instance
 logger = GrantAgentLogger()
 
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=logger._after_fork_in_child)
+
 def get_logger(module_name: str = None) -> logging.Logger:
     """Convenience function to get logger for a module"""
     return logger.get_logger(module_name)